@@ -0,0 +1,184 @@
+"""
+compact arrays of numbers for slow++, stored in a numpy array when numpy is installed and in an array from the array module otherwise
+
+the operators work on each element, an array and a number combine the number with every element and two arrays of the same length combine the elements at the same positions
+an array holds ints, floats or bools, arithmetic gives floats if either side has floats and comparisons give bools
+"""
+
+import array
+import itertools
+import operator
+
+# numpy is optional, without it the operators loop over the elements in python
+# it is slow to import, so it is only imported when the first array is made, every other function works on arrays that were already made
+numpy = None
+# whether importing numpy has been tried
+tried = False
+
+def importnumpy ():
+	global numpy, tried
+	if tried:
+		return
+	tried = True
+	try:
+		import numpy
+	except ImportError:
+		numpy = None
+
+# the numpy dtype and the array typecode of each type of element
+TYPES = {
+	"int" : ("int64", "q"),
+	"float" : ("float64", "d"),
+	"bool" : ("bool", "b"),
+}
+# the type of element for each numpy dtype kind
+DTYPEKINDS = {"i" : "int", "u" : "int", "f" : "float", "b" : "bool"}
+
+class NumArray ():
+	__slots__ = ("data", "kind")
+	def __init__ (self, data, kind):
+		self.data = data
+		self.kind = kind
+	def tolist (self):
+		if numpy == None and self.kind == "bool":
+			return [bool(value) for value in self.data]
+		return self.data.tolist()
+	def __len__ (self):
+		return len(self.data)
+	def __getitem__ (self, index):
+		if numpy != None:
+			return self.data[index].item()
+		value = self.data[index]
+		return bool(value) if self.kind == "bool" else value
+	def __iter__ (self):
+		return iter(self.tolist())
+	# an array of comparisons isn't true or false, a reduction decides what it means
+	def __bool__ (self):
+		raise ValueError("an array is neither true nor false, use asum, amin or amax on it")
+	def __str__ (self):
+		return f"array({self.tolist()})"
+	def __repr__ (self):
+		return self.__str__()
+	# applies op to each element and other, reverse puts other on the left
+	def _apply (self, other, op, kind, reverse=False):
+		if numpy != None:
+			left = self.data
+			right = other.data if type(other) == NumArray else other
+			# numpy adds bools as bools, without numpy they add up as numbers
+			if kind != "bool":
+				left, right = numeric(left), numeric(right)
+			data = op(right, left) if reverse else op(left, right)
+			return NumArray(data, DTYPEKINDS[data.dtype.kind])
+		if type(other) == NumArray:
+			if len(other.data) != len(self.data):
+				raise ValueError(f"arrays have different lengths, {len(self.data)} and {len(other.data)}")
+			right = other.data
+			otherkind = other.kind
+		else:
+			right = itertools.repeat(other)
+			otherkind = "float" if type(other) == float else "int"
+		values = map(op, right, self.data) if reverse else map(op, self.data, right)
+		if kind == None:
+			kind = "float" if "float" in (self.kind, otherkind) else "int"
+		return NumArray(array.array(TYPES[kind][1], values), kind)
+	def __add__ (self, other):
+		return self._apply(other, operator.add, None)
+	def __radd__ (self, other):
+		return self._apply(other, operator.add, None, True)
+	def __sub__ (self, other):
+		return self._apply(other, operator.sub, None)
+	def __rsub__ (self, other):
+		return self._apply(other, operator.sub, None, True)
+	def __mul__ (self, other):
+		return self._apply(other, operator.mul, None)
+	def __rmul__ (self, other):
+		return self._apply(other, operator.mul, None, True)
+	def __truediv__ (self, other):
+		return self._apply(other, operator.truediv, "float")
+	def __rtruediv__ (self, other):
+		return self._apply(other, operator.truediv, "float", True)
+	def __mod__ (self, other):
+		return self._apply(other, operator.mod, None)
+	def __rmod__ (self, other):
+		return self._apply(other, operator.mod, None, True)
+	def __neg__ (self):
+		return self._apply(-1, operator.mul, None)
+	# the interpreter checks for missing values with == None and != None, so None is compared with the whole array
+	def __eq__ (self, other):
+		if other is None:
+			return False
+		return self._apply(other, operator.eq, "bool")
+	def __ne__ (self, other):
+		if other is None:
+			return True
+		return self._apply(other, operator.ne, "bool")
+	def __lt__ (self, other):
+		return self._apply(other, operator.lt, "bool")
+	def __gt__ (self, other):
+		return self._apply(other, operator.gt, "bool")
+	def __le__ (self, other):
+		return self._apply(other, operator.le, "bool")
+	def __ge__ (self, other):
+		return self._apply(other, operator.ge, "bool")
+	# arrays compare element by element so they can't be dict keys
+	__hash__ = None
+
+# a numpy array of bools as ints
+def numeric (data):
+	if type(data) == numpy.ndarray and data.dtype.kind == "b":
+		return data.astype("int64")
+	return data
+
+# makes an array from a list or another array, the type is int unless there are floats
+def make (values, kind=None):
+	importnumpy()
+	if type(values) == NumArray:
+		values = values.tolist()
+	if kind == None:
+		kind = "float" if any(type(value) == float for value in values) else "int"
+	if kind not in TYPES:
+		raise ValueError(f"arrays hold {', '.join(TYPES)}, not {kind}")
+	if numpy != None:
+		return NumArray(numpy.array(values, dtype=TYPES[kind][0]), kind)
+	return NumArray(array.array(TYPES[kind][1], values), kind)
+
+def zeros (size, kind="float"):
+	importnumpy()
+	if numpy != None:
+		return NumArray(numpy.zeros(size, dtype=TYPES[kind][0]), kind)
+	return NumArray(array.array(TYPES[kind][1], bytes(size * array.array(TYPES[kind][1]).itemsize)), kind)
+
+# the numbers from start up to end, like a for loop
+def arange (start, end, step=1):
+	importnumpy()
+	kind = "float" if float in (type(start), type(end), type(step)) else "int"
+	if numpy != None:
+		return NumArray(numpy.arange(start, end, step, dtype=TYPES[kind][0]), kind)
+	if kind == "int":
+		return NumArray(array.array("q", range(start, end, step)), kind)
+	count = max(0, -int(-(end - start) // step))
+	return NumArray(array.array("d", (start + i * step for i in range(count))), kind)
+
+def tolist (values):
+	return values.tolist()
+
+# reductions, they give plain numbers
+def total (values):
+	if numpy != None:
+		return values.data.sum().item()
+	return sum(values.data)
+
+def smallest (values):
+	if numpy != None:
+		return values.data.min().item()
+	value = min(values.data)
+	return bool(value) if values.kind == "bool" else value
+
+def largest (values):
+	if numpy != None:
+		return values.data.max().item()
+	value = max(values.data)
+	return bool(value) if values.kind == "bool" else value
+
+def mean (values):
+	return total(values) / len(values)
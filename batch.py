@@ -0,0 +1,72 @@
+"""
+runs many slow++ scripts in parallel, each in its own Runner on a pool of processes
+
+usage: python batch.py [--jobs n] [--quiet] script-or-glob ...
+
+the output of each script is captured and printed after it, in the order the scripts were given, along with how long it took and the error if it failed
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import glob
+import io
+import sys
+import time
+
+from interpreter import Runner
+
+# runs a single script, used by the worker processes, returns what it printed, how long it took and the error if it failed
+def runscript (path):
+	output = io.StringIO()
+	error = None
+	start = time.perf_counter()
+	try:
+		with open(path) as f:
+			source = f.read()
+		with contextlib.redirect_stdout(output):
+			Runner(source, path).run()
+	except Exception as e:
+		error = f"{type(e).__name__}: {e}"
+	return {
+		"path" : path,
+		"output" : output.getvalue(),
+		"seconds" : time.perf_counter() - start,
+		"error" : error,
+	}
+
+# expands the globs in a list of scripts, a pattern that matches nothing is kept so that it is reported as a failure
+def expand (patterns):
+	paths = []
+	for pattern in patterns:
+		matches = sorted(glob.glob(pattern))
+		paths.extend(matches or [pattern])
+	return paths
+
+# runs scripts on a pool of jobs processes, one per cpu by default, the results are in the same order as the scripts
+def runbatch (paths, jobs=None):
+	with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+		return list(pool.map(runscript, paths))
+
+def main ():
+	parser = argparse.ArgumentParser(description="runs slow++ scripts in parallel")
+	parser.add_argument("scripts", nargs="+", help="scripts or glob patterns")
+	parser.add_argument("--jobs", type=int, default=None, help="how many scripts run at once, the number of cpus by default")
+	parser.add_argument("--quiet", action="store_true", help="only reports the timing and failures")
+	args = parser.parse_args()
+	start = time.perf_counter()
+	results = runbatch(expand(args.scripts), args.jobs)
+	failed = 0
+	for result in results:
+		status = "ok"
+		if result["error"] != None:
+			status = "failed: " + result["error"]
+			failed += 1
+		print(f"== {result['path']} ({result['seconds']:.3f}s) {status}")
+		if not args.quiet and result["output"] != "":
+			print(result["output"], end="" if result["output"][-1] == "\n" else "\n")
+	print(f"== {len(results)} scripts, {failed} failed, {time.perf_counter() - start:.3f}s")
+	return 1 if failed > 0 else 0
+
+if __name__ == "__main__":
+	sys.exit(main())
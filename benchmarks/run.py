@@ -0,0 +1,176 @@
+"""
+runs the slow++ programs in this directory and reports how fast the interpreter runs them
+
+usage: python benchmarks/run.py [name ...] [--engine line|vm|native] [--repeat n] [--tolerance fraction] [--save]
+
+each program runs through a Runner in a fresh python process, so that peak memory is measured per program, once with #profile on to count the lines and calls it makes and then --repeat times for the timing
+the results are compared against baseline.json, a program that got slower than the baseline by more than the tolerance is a regression, --save stores the results as the new baseline
+every program is also run once by each engine, and once more from its cached compiled form, and fails if they print different output, the programs in "checks" are only run that way, they cover the statements that each engine handles its own way
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# peak memory is only measured where the resource module exists
+try:
+	import resource
+except ImportError:
+	resource = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+BASELINE = os.path.join(HERE, "baseline.json")
+CHECKS = os.path.join(HERE, "checks")
+
+# the header flags that select each engine
+ENGINES = {
+	"line" : "",
+	"vm" : "#vm True\n",
+	"native" : "#native True\n",
+}
+
+# runs a program in this process, used by the child processes that the benchmarks run in, a cached program is compiled beside the script and reused by the next run
+def child (directory, result, cached=False):
+	os.chdir(directory)
+	sys.path.insert(0, ROOT)
+	from interpreter import Runner
+	with open("code.slow++") as f:
+		runner = Runner(f.read(), "code.slow++" if cached else None)
+	start = time.perf_counter()
+	runner.run()
+	seconds = time.perf_counter() - start
+	# ru_maxrss is in kilobytes on linux
+	memory = None
+	if resource != None:
+		memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+	with open(result, "w") as f:
+		json.dump({"seconds" : seconds, "memory" : memory}, f)
+
+# runs a program once in a new process, returns what the child measured and what the program printed
+# a cached program runs twice in the same directory, the first run writes the cache and what the second run, which loads it, measured is returned
+def runonce (source, profile=False, cached=False):
+	directory = tempfile.mkdtemp()
+	try:
+		if profile:
+			source = '#profile True\n#profilefile "profile.json"\n' + source
+		with open(os.path.join(directory, "code.slow++"), "w") as f:
+			f.write(source)
+		result = os.path.join(directory, "result.json")
+		command = [sys.executable, os.path.abspath(__file__), "--child", directory, result]
+		if cached:
+			command.append("--cached")
+		for i in range(2 if cached else 1):
+			process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+			if process.returncode != 0 or not os.path.exists(result):
+				raise RuntimeError(process.stderr.strip().split("\n")[-1])
+		with open(result) as f:
+			measured = json.load(f)
+		measured["output"] = process.stdout
+		if profile:
+			with open(os.path.join(directory, "profile.json")) as f:
+				measured["profile"] = json.load(f)
+		return measured
+	finally:
+		shutil.rmtree(directory)
+
+# measures a program, the fastest of the timed runs is kept
+def measure (path, engine, repeat):
+	with open(path) as f:
+		source = ENGINES[engine] + f.read()
+	profile = runonce(source, True)["profile"]
+	lines = sum(entry["count"] for entry in profile["lines"])
+	calls = sum(entry["count"] for entry in profile["functions"])
+	runs = [runonce(source) for i in range(repeat)]
+	seconds = min(run["seconds"] for run in runs)
+	memory = None
+	if runs[0]["memory"] != None:
+		memory = max(run["memory"] for run in runs)
+	return {
+		"seconds" : seconds,
+		"lines" : lines,
+		"calls" : calls,
+		"lines_per_sec" : lines / seconds,
+		"calls_per_sec" : calls / seconds,
+		"peak_mb" : memory,
+	}
+
+# runs a program once with each engine and once from its cache, returns the runs whose output isn't the same as the line by line interpreter's
+def compare (path):
+	with open(path) as f:
+		source = f.read()
+	outputs = {engine : runonce(header + source)["output"] for engine, header in ENGINES.items()}
+	outputs["cached"] = runonce(source, cached=True)["output"]
+	return [run for run in outputs if outputs[run] != outputs["line"]]
+
+def main ():
+	parser = argparse.ArgumentParser(description="runs the slow++ benchmarks")
+	parser.add_argument("names", nargs="*", help="the benchmarks to run, all of them by default")
+	parser.add_argument("--engine", choices=list(ENGINES), default="line")
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--tolerance", type=float, default=0.15, help="how much slower than the baseline a benchmark can get before it is a regression")
+	parser.add_argument("--save", action="store_true", help="stores the results as the baseline")
+	parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+	parser.add_argument("--cached", action="store_true", help=argparse.SUPPRESS)
+	args = parser.parse_args()
+	if args.child != None:
+		child(*args.child, args.cached)
+		return 0
+	names = args.names or sorted(name[:-7] for name in os.listdir(HERE) if name.endswith(".slow++"))
+	checks = [] if args.names else sorted(name[:-7] for name in os.listdir(CHECKS) if name.endswith(".slow++"))
+	baseline = {}
+	if os.path.exists(BASELINE):
+		with open(BASELINE) as f:
+			baseline = json.load(f)
+	previous = baseline.get(args.engine, {})
+	results = {}
+	failed = False
+	print(f"{'benchmark':<14} {'seconds':>9} {'lines/sec':>11} {'calls/sec':>11} {'peak mb':>8}  baseline")
+	for name in names:
+		try:
+			result = measure(os.path.join(HERE, name + ".slow++"), args.engine, args.repeat)
+			differs = compare(os.path.join(HERE, name + ".slow++"))
+		except Exception as e:
+			print(f"{name:<14} failed: {e}")
+			failed = True
+			continue
+		results[name] = result
+		memory = "-" if result["peak_mb"] == None else f"{result['peak_mb']:.1f}"
+		compared = "new"
+		if name in previous:
+			change = result["seconds"] / previous[name]["seconds"] - 1
+			compared = f"{change:+.1%}"
+			if change > args.tolerance:
+				compared += " REGRESSION"
+				failed = True
+		if len(differs) > 0:
+			compared += f" OUTPUT DIFFERS ({', '.join(differs)})"
+			failed = True
+		print(f"{name:<14} {result['seconds']:>9.4f} {result['lines_per_sec']:>11.0f} {result['calls_per_sec']:>11.0f} {memory:>8}  {compared}")
+	for name in checks:
+		try:
+			differs = compare(os.path.join(CHECKS, name + ".slow++"))
+		except Exception as e:
+			print(f"{name:<14} failed: {e}")
+			failed = True
+			continue
+		if len(differs) > 0:
+			print(f"{name:<14} output differs ({', '.join(differs)})")
+			failed = True
+		else:
+			print(f"{name:<14} same output")
+	if args.save:
+		previous.update(results)
+		baseline[args.engine] = previous
+		with open(BASELINE, "w") as f:
+			json.dump(baseline, f, indent="\t", sort_keys=True)
+			f.write("\n")
+	return 1 if failed else 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,29 @@
+"""
+runs a slow++ script without entering the interactive prompt
+
+usage: python cli.py script.slow++
+"""
+
+import sys
+
+from interpreter import Runner
+
+def main (argv):
+	if len(argv) != 2:
+		print("usage: python cli.py script.slow++", file=sys.stderr)
+		return 2
+	with open(argv[1]) as f:
+		source = f.read()
+	runner = Runner(source, argv[1])
+	try:
+		runner.run()
+	except Exception as e:
+		# the EXCNOHANDLE flag shows the full traceback
+		if runner.flags["EXCNOHANDLE"]:
+			raise
+		print(f"{type(e).__name__}: {e}", file=sys.stderr)
+		return 1
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv))
@@ -0,0 +1,2340 @@
+__version = "slow++ a-1.0.1"
+
+"""
+the slow++ interpreter, importing this module has no side effects
+
+	from interpreter import Runner
+	Runner(source).run()
+"""
+
+import ast
+import collections
+import copy
+import hashlib
+import json
+import marshal
+import operator
+import os
+import re
+import sys
+import tempfile
+import time
+
+import arrays
+
+# imports temporary functions
+from temp import *
+
+# changes whenever the layout of cached programs changes, so that older caches are ignored
+CACHEVERSION = 1
+
+# python frames kept free below the recursion limit, enough for the call that hands off to the bytecode and for the blocks nested in the function it calls from
+STACKRESERVE = 200
+
+# token types
+INT, STR, MAT, ASS, REF, PAR, LOG, EQU, FUN, INV, CUR, SQU, SEP, KEY, LIT, LST, DCT, SYM, ARR, RNG = "INT", "STR", "MAT", "ASS", "REF", "PAR", "LOG", "EQU", "FUN", "INV", "CUR", "SQU", "SEP", "KEY", "LIT", "LST", "DCT", "SYM", "ARR", "RNG"
+
+SUBSCRIPT = ("STR", "LST", "DCT", "ARR", "RNG")
+
+# the lexer, the name of the group that matches is the token type, or one of:
+# SPC for trailing whitespace, COM for a comment, NAM for a name, INC for "++" and "--" and UNC for an unclosed string
+LEXER = re.compile(r"""
+	\s*(?:
+	(?P<COM>//.*)
+	|(?P<INT>-?\d+(?:\.\d*)?)
+	|(?P<NAM>[^\W\d_][^\W_]*)
+	|(?P<STR>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+	|(?P<INC>\+\+|--)
+	|(?P<EQU>==|[<>]=?)
+	|(?P<ASS>[-+*/]?=)
+	|(?P<MAT>[-+*/])
+	|(?P<LOG>[\^%&|!])
+	|(?P<PAR>[()])
+	|(?P<SQU>[\[\]])
+	|(?P<CUR>[{}])
+	|(?P<SEP>,)
+	|(?P<SYM>[:.])
+	|(?P<UNC>["'])
+	|(?P<INV>.)
+	|(?P<SPC>$)
+	)
+""", re.S | re.X)
+# the text of a line without its indentation or a comment at its end, the line is lexed so that "//" in a string isn't taken as a comment
+def stripcomment (line):
+	text = line.strip(" \t")
+	if "//" not in text:
+		return text
+	for m in LEXER.finditer(text):
+		if m.lastgroup == "COM":
+			return text[:m.start("COM")].rstrip(" \t")
+	return text
+
+# an escaped character in a string
+ESCAPES = re.compile(r"\\(.)", re.S)
+
+# binding power of operators, higher binds tighter, assignments bind looser than all of these
+PRECEDENCE = {
+	"|" : 2,
+	"&" : 3,
+	"!" : 4,
+	"==" : 5, "<" : 5, ">" : 5, "<=" : 5, ">=" : 5,
+	"^" : 6,
+	"+" : 7, "-" : 7,
+	"*" : 8, "/" : 8, "%" : 8,
+}
+
+# implementations of the math and comparison operators
+MATOPS = {
+	"+" : operator.add,
+	"-" : operator.sub,
+	"*" : operator.mul,
+	"/" : operator.truediv,
+}
+EQUOPS = {
+	"==" : operator.eq,
+	"<" : operator.lt,
+	">" : operator.gt,
+	"<=" : operator.le,
+	">=" : operator.ge,
+}
+# operators that the bytecode computes with a single instruction
+BINOPS = dict(MATOPS, **EQUOPS)
+BINOPS["^"] = operator.xor
+BINOPS["%"] = operator.mod
+
+# python operators that slow++ operators are translated into
+PYOPS = {
+	"+" : ast.Add,
+	"-" : ast.Sub,
+	"*" : ast.Mult,
+	"/" : ast.Div,
+	"^" : ast.BitXor,
+	"%" : ast.Mod,
+	"&" : ast.And,
+	"|" : ast.Or,
+	"==" : ast.Eq,
+	"<" : ast.Lt,
+	">" : ast.Gt,
+	"<=" : ast.LtE,
+	">=" : ast.GtE,
+}
+
+# bytecode instructions
+PUSH, LOAD, LOADF, STORE, STOREF, POP, DUP, BIN, NEG, NOT, JUMP, JUMPF, JUMPFK, JUMPTK, CALL, CALLS, NEWARGS, APPEND, EXTEND, MKLST, MKDCT, INDEX, RANGE, ITER, FORITER, RET, TAILCALL, LINE, ALIAS, NEW, HALT, BINC, BINL, BINLF, AUG, AUGF = range(36)
+
+"""
+BYTECODE:
+	instructions are (instruction, argument) tuples that work on a stack of tokens
+	PUSH token -> pushes a constant
+	LOAD name -> pushes a global variable
+	LOADF (slot, name) -> pushes a local variable from the current frame, or the global with the same name while the local is unset
+	STORE name -> pops a value into a global variable
+	STOREF slot -> pops a value into a local variable
+	POP, DUP -> drops or copies the top value
+	BIN function -> replaces the top two values with the result of the operator
+	BINC (function, value), BINL (function, name), BINLF (function, slot, name) -> replaces the top value with the result of the operator on it and a constant, a global or a local, the right side of most operators is one of these
+	NEG, NOT -> replaces the top value with its negation
+	JUMP position -> continues at the position
+	JUMPF position -> pops a value and jumps if it is false
+	JUMPFK, JUMPTK position -> jumps if the top value is false (or true) and keeps it, otherwise pops it, used by "&" and "|"
+	CALL (name, count) -> pops the arguments and calls the function
+	NEWARGS, APPEND, EXTEND, CALLS name -> builds a list of arguments that contains star arguments then calls the function with it
+	MKLST count, MKDCT count -> builds a list or dict from the top values
+	INDEX -> subscripts the second value with the top value
+	RANGE -> replaces the start, end and step of a for loop with an iterator
+	ITER -> replaces the collection of a for in loop with an iterator
+	FORITER (name, slot, end, body) -> sets the loop variable to the next value and continues at body, or pops the iterator and continues at end when it is done, slot is None for globals, the end of a loop's body repeats it so that going round the loop needs no jump
+	RET -> returns from a function, the return value stays on the stack
+	TAILCALL (name, count) -> pops the arguments and calls a script function in place of the function that is returning, otherwise calls the function like CALL, always followed by RET
+	LINE index -> marks the line being executed
+	ALIAS (name, alias) -> creates an alias
+	NEW (token, deep) -> pushes a copy of a constant list or dict
+	AUG (function, name), AUGF (function, slot, name) -> pops a value and combines it into a global or local variable for +=, -= and the rest, function is None for += which adds strings to a builder
+	HALT -> ends the program
+"""
+
+"""
+TOKENS:
+	INT -> integer
+	STR -> string
+	MAT -> mathmatical operator
+	ASS -> assignment operator
+	REF -> reference
+	PAR -> parentheses
+	LOG -> logical operators
+	EQU -> unique use case: testing conditions
+	FUN -> function
+	INV -> invalid token, used to mark unknown symbols within the code
+	CUR -> marks where curly bracket is
+	SQU -> marks where a square bracket is
+	SEP -> marks a seperator
+	KEY -> a statement
+	LIT -> literal
+	LST -> a list
+	DCT -> a dict
+	SYM -> a symbol
+	ARR -> a typed array of numbers
+	RNG -> a range of numbers, its numbers are only made as they are used
+"""
+
+"""
+NODES:
+	lines are compiled into tuples, the first item of each tuple is its kind
+	("CON", token) -> a constant
+	(REF, name) -> a reference to a global
+	("LOC", slot, name) -> a reference to a local variable of the function the line is in
+	(MAT, op, left, right) -> math, left is None for negation
+	(LOG, op, left, right) -> logic, left is None for "!"
+	(EQU, op, left, right) -> a comparison
+	(ASS, op, name, value, slot) -> an assignment, slot is None for globals
+	(FUN, name, args, star) -> a function call, star arguments are ("STA", node) and star is True if there are any
+	(LST, items) -> a list
+	(DCT, pairs) -> a dict
+	(SQU, target, index) -> a subscript
+	("NEW", token, deep) -> a constant list or dict, copied each time it is evaluated, deep is True if it contains lists or dicts
+"""
+
+class Token ():
+	# tokens only ever have these two attributes, so they are stored without a dict
+	__slots__ = ("type", "value")
+	def __init__ (self, type, value=None):
+		self.type = type
+		self.value = value
+	def detokenize (self):
+		return self.value
+	def __getitem__ (self, key):
+		if self.type in SUBSCRIPT:
+			return self.value[key]
+		else:
+			raise TypeError("Invalid Subscripting Get Operation")
+	def __setitem__ (self, key, value):
+		if self.type in (LST, DCT):
+			self.value[key] = value
+		else:
+			raise TypeError("Invalid Subscripting Set Operation")
+	def __len__ (self):
+		if self.type in SUBSCRIPT:
+			return len(self.value)
+		else:
+			raise TypeError("Invalid Len Operation")
+	def __bool__ (self):
+		return bool(self.detokenize())
+	def __str__ (self):
+		if self.type == STR:
+			return f'Token({self.type}, "{self.value}")'
+		return f"Token({self.type}, {self.value})"
+	def __repr__ (self):
+		return self.__str__()
+
+class Builder (Token):
+	"""
+	a string built up by +=, the pieces are only joined when the string is used, so appending doesn't copy the string built so far
+	builders made by appending share one list of pieces, each builder is only the first size pieces, so an older builder keeps its value when a newer one is appended to
+	"""
+	__slots__ = ("parts", "size", "text")
+	def __init__ (self, parts, size):
+		self.type = STR
+		self.parts = parts
+		self.size = size
+		# the joined string, once it has been used
+		self.text = None
+	@property
+	def value (self):
+		if self.text == None:
+			self.text = "".join(self.parts[:self.size])
+		return self.text
+	# returns the builder with text added, the list of pieces is only copied if another builder already appended to it
+	def append (self, text):
+		if len(self.parts) == self.size:
+			self.parts.append(text)
+			return Builder(self.parts, self.size + 1)
+		return Builder(self.parts[:self.size] + [text], self.size + 1)
+
+# the token type used for each type of python value, values of any other type become literals
+VALUETYPES = {
+	int : INT,
+	float : INT,
+	str : STR,
+	bool : LIT,
+	list : LST,
+	dict : DCT,
+	arrays.NumArray : ARR,
+	range : RNG,
+}
+# python values that are used as lists, they are converted into lists when they are wrapped, the pairs of a dict become lists of a key and a value
+LISTLIKE = {
+	tuple : list,
+	type({}.keys()) : list,
+	type({}.values()) : list,
+	type({}.items()) : lambda items: [[key, value] for key, value in items],
+}
+
+# tokens are never changed after they are created, so these values share a single token
+TRUE, FALSE, NONE = Token(LIT, True), Token(LIT, False), Token(LIT, None)
+# what next gives for an iterator that is done, a loop over a list can have None as a value
+DONE = object()
+SMALLINTS = [Token(INT, i) for i in range(-5, 257)]
+
+# wraps a python value in a token
+def totoken (value):
+	t = type(value)
+	if t == int:
+		if -5 <= value <= 256:
+			return SMALLINTS[value+5]
+		return Token(INT, value)
+	elif t == bool:
+		return TRUE if value else FALSE
+	elif value is None:
+		return NONE
+	kind = VALUETYPES.get(t)
+	if kind == None:
+		if t in LISTLIKE:
+			return Token(LST, LISTLIKE[t](value))
+		# builtins that take tokens give tokens back
+		if t == Token or t == Builder:
+			return value
+		kind = LIT
+	return Token(kind, value)
+
+# adds right to a variable's value for +=, strings become builders so that building a string one piece at a time takes linear time
+def addto (current, right):
+	if current.type == STR and right.type == STR:
+		if type(current) == Builder:
+			return current.append(right.value)
+		return Builder([current.value, right.value], 2)
+	return totoken(current.value + right.value)
+
+# the string builder builtins work on the builders that += makes, they are called with tokens instead of values so that a builder is passed in without being joined
+def strbuilder (text=None):
+	if text == None:
+		return Builder([], 0)
+	return addto(Builder([], 0), text)
+
+# returns the builder with text added, the same as builder += text
+def strappend (builder, text):
+	return addto(builder, text)
+
+def strjoin (builder):
+	return totoken(builder.value)
+
+# a hash of the code that compiles programs, worked out the first time it is needed, so that a cache written by a changed interpreter isn't used even if CACHEVERSION wasn't bumped
+FINGERPRINT = None
+def fingerprint ():
+	global FINGERPRINT
+	if FINGERPRINT == None:
+		digest = hashlib.sha256()
+		for name in ("interpreter.py", "temp.py"):
+			with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), "rb") as f:
+				digest.update(f.read())
+		FINGERPRINT = digest.hexdigest()
+	return FINGERPRINT
+
+# the key that a cached program must have to be used for a source, caches are only valid for the same source, the same interpreter and the same builtins, which decide what names lex as functions
+def cachekey (source, builtins):
+	names = hashlib.sha256(" ".join(sorted(builtins)).encode()).hexdigest()
+	return f"{__version} {CACHEVERSION} {fingerprint()} {names} {hashlib.sha256(source.encode()).hexdigest()}"
+
+class Runner ():
+	def __init__ (self, source="", path=None):
+		# the text of the program
+		self.source = source
+		# the file the program was read from, the compiled program is cached beside it
+		self.path = path
+		# the lines of the program, set when it is loaded
+		self.code = []
+		# functions, maps from a name to the start and end lines of the function
+		self.funcs = {}
+		# function args
+		self.funcargs = {}
+		# aliases
+		self.funcaliases = {}
+		# functions translated into python functions, maps from a name to the python function
+		self.nativefuncs = {}
+		# variables
+		self.vars = {
+			"True":TRUE,
+			"False":FALSE,
+			"None":NONE
+		}
+		# lines that are contained within function bodies, used to ensure that parts of functions are not executed outside of a function call
+		self.funclines = set()
+		# maps from a function name to the slot of each of its parameters and local variables, parameters come first
+		self.funcslots = {}
+		# maps from each line in a function body to the name of the function
+		self.linefuncs = {}
+		# frames that calls to each function can reuse, maps from a function name to a list of free frames
+		self.framepool = {}
+		# the local variables of the call being run, a list indexed by slot, and the slots of the function being run
+		self.frame = []
+		self.slots = {}
+		# how many calls deep the line by line interpreter is
+		self.depth = 0
+		# the bytecode that deep calls are run as, compiled the first time it is needed, False if the program can't be compiled
+		self.program = None
+		# tokens for each line of code, maps from a line index to that line's tokens, cleared whenever the code changes
+		self.tokencache = {}
+		# compiled statements for each line of code, cleared along with the token cache
+		self.nodecache = {}
+		# maps from the line that opens a block to the line that closes it
+		self.blockends = {}
+		# maps from an if or elif line to the line of the next branch in its chain
+		self.branches = {}
+		# lines that never run, comments, blank lines, header flags and the bodies of branches that can't be taken
+		self.skiplines = set()
+		# names of literals that the program never assigns to, so they can be folded
+		self.constnames = set()
+		# builtin functions
+		self.builtins = {
+			"print":print,
+			"input":input,
+			"hash":hash,
+			"dir":dir,
+			"len":len,
+			"pow":pow,
+			"round":round,
+			"min":min,
+			"max":max,
+			"range":range,
+			# typed arrays
+			"array":arrays.make,
+			"zeros":arrays.zeros,
+			"arange":arrays.arange,
+			"alist":arrays.tolist,
+			"asum":arrays.total,
+			"amin":arrays.smallest,
+			"amax":arrays.largest,
+			"amean":arrays.mean,
+		}
+		# builtins that are called with tokens instead of the values in them
+		self.tokenbuiltins = set()
+		# the names of all funcitons in program
+		self.funcnames = list(self.builtins.keys())
+		# statements
+		self.statements = ("if", "elif", "else", "alias", "return", "for", "while", "in")
+		# methods that evaluate each kind of compiled node
+		self.nodeops = {
+			"CON" : self.doCON,
+			REF : self.doREF,
+			"LOC" : self.doLOC,
+			MAT : self.doMAT,
+			LOG : self.doLOG,
+			EQU : self.doEQU,
+			ASS : self.doASS,
+			FUN : self.doFUN,
+			LST : self.doSQU,
+			SQU : self.doSQU,
+			DCT : self.doCUR,
+			"NEW" : self.doNEW,
+		}
+		# the line the interpreter is currently executing
+		self.executionline = 0
+		# switches between tasks when the async flag is set
+		self.scheduler = None
+		# traces kept in memory, only used when tracing without a trace file
+		self.tracelog = collections.deque()
+		# the open trace file
+		self.tracestream = None
+		# the profile of lines and functions, maps from a line index or function name to [count, total seconds, own seconds]
+		self.profile = {"lines" : {}, "functions" : {}}
+		# the start time and the time spent in nested runs of each line and function being profiled
+		self.profilestack = {"lines" : [], "functions" : []}
+		# how many runs of each line and function are active, recursive runs are already part of the total of the outer run
+		self.profileactive = {"lines" : {}, "functions" : {}}
+		# config for showing flags
+		self.sfconfig = [(0, "*")]
+		# flags
+		self.flags = {
+			# flags used for configuring the interface
+			"intce" : False,
+			# flags only used for debugging the interpreter
+			"DEVDB" : False,
+			"EXCNOHANDLE" : False,
+			# debugging flags
+			"showfams" : False,
+			"showflags" : False,
+			"showvars" : False,
+			"showlocals" : False,
+			"pel" : False,
+			"funcnames" : False,
+			"funclines" : False,
+			"funcargs" : False,
+			# runs the program as bytecode instead of line by line
+			"vm" : False,
+			# translates functions into python functions when possible
+			"native" : False,
+			# folds constant expressions and drops code that can never run before the program starts
+			"fold" : True,
+			# saves the compiled program beside the script and reuses it while the script is unchanged
+			"cache" : True,
+			# how many calls deep the line by line interpreter goes before calls run as bytecode, which keeps its calls on its own stack instead of python's
+			"linedepth" : 50,
+			# runs the program on an asyncio event loop, functions can be started as tasks that run while other tasks wait
+			"async" : False,
+			# tracing, each category traces a part of the interpreter
+			"trace-lex" : False,
+			"trace-eval" : False,
+			"trace-call" : False,
+			"trace-loop" : False,
+			"trace-fold" : False,
+			# 1 traces lines, calls and loops, 2 also traces every expression, return value and token
+			"tracelevel" : 1,
+			# the file traces are written to, when None they are kept in memory and printed on exit
+			"tracefile" : None,
+			# how many traces are kept in memory
+			"tracesize" : 1000,
+			# counts and times every line and function call, the hot spots are shown on exit
+			"profile" : False,
+			# the file the full profile is written to as JSON
+			"profilefile" : None,
+			# how many lines and functions the profile shows
+			"profilesize" : 20,
+			# temporary wrappers for list operations
+			"tmp-list-join" : True,
+			"tmp-list-append" : True,
+			"tmp-list-pop" : True,
+			"tmp-list-insert" : True,
+			"tmp-list-count" : True,
+			"tmp-list-extend" : True,
+			"tmp-list-index" : True,
+			"tmp-list-copy" : True,
+			"tmp-list-reverse" : True,
+			# temporary wrappers for dict operations
+			"tmp-dict-update" : True,
+			"tmp-dict-pop" : True,
+			"tmp-dict-copy" : True,
+			"tmp-dict-keys" : True,
+			"tmp-dict-items" : True,
+			"tmp-dict-values" : True,
+			# temporary wrappers for building strings
+			"tmp-str-builder" : True,
+			"tmp-str-append" : True,
+			"tmp-str-join" : True,
+		}
+		# flag families
+		self.ffams = {
+			"ALL" : tuple(name for name in self.flags if type(self.flags[name]) == bool),
+			"FUNCS" : ("funcnames", "funclines", "funcargs"),
+			"VARS" : ("showvars", "showlocals"),
+			"DEBUG" : ("!FUNCS", "!VARS", "pel", "showflags", "showfams"),
+			"TMP" : ("!TMP-LIST", "!TMP-DICT", "!TMP-STR"),
+			"TRACE" : ("trace-lex", "trace-eval", "trace-call", "trace-loop", "trace-fold"),
+			"TMP-LIST" : ("tmp-list-join", "tmp-list-append", "tmp-list-pop", "tmp-list-insert", "tmp-list-count", "tmp-list-extend", "tmp-list-index", "tmp-list-copy", "tmp-list-reverse"),
+			"TMP-DICT" : ("tmp-dict-update", "tmp-dict-pop", "tmp-dict-copy", "tmp-dict-keys", "tmp-dict-items", "tmp-dict-values"),
+			"TMP-STR" : ("tmp-str-builder", "tmp-str-append", "tmp-str-join"),
+		}
+		# temp names
+		self.tmpnames = {
+			# temp list funcs
+			"tmp-list-join" : "ljoin",
+			"tmp-list-append" : "lappend",
+			"tmp-list-pop" : "lpop",
+			"tmp-list-insert" : "linsert",
+			"tmp-list-copy" : "lcopy",
+			"tmp-list-count" : "lcount",
+			"tmp-list-reverse" : "lreverse",
+			"tmp-list-extend" : "lextend",
+			"tmp-list-index" : "lindex",
+			# temp dict funcs
+			"tmp-dict-update" : "dupdate",
+			"tmp-dict-pop" : "dpop",
+			"tmp-dict-copy" : "dcopy",
+			"tmp-dict-keys" : "dkeys",
+			"tmp-dict-items" : "ditems",
+			"tmp-dict-values" : "dvalues",
+			# temp string funcs
+			"tmp-str-builder" : "sbuilder",
+			"tmp-str-append" : "sappend",
+			"tmp-str-join" : "sjoin",
+		}
+		# temp funcs
+		self.tmpfuncs = {
+			# temp list funcs
+			"tmp-list-join" : tmplistjoin,
+			"tmp-list-append" : tmplistappend,
+			"tmp-list-pop" : tmplistpop,
+			"tmp-list-insert" : tmplistinsert,
+			"tmp-list-copy" : tmplistcopy,
+			"tmp-list-count" : tmplistcount,
+			"tmp-list-reverse" : tmplistreverse,
+			"tmp-list-extend" : tmplistextend,
+			"tmp-list-index" : tmplistindex,
+			# temp dict funcs
+			"tmp-dict-update" : tmpdictupdate,
+			"tmp-dict-pop" : tmpdictpop,
+			"tmp-dict-copy" : tmpdictcopy,
+			"tmp-dict-keys" : tmpdictkeys,
+			"tmp-dict-items" : tmpdictitems,
+			"tmp-dict-values" : tmpdictvalues,
+			# temp string funcs
+			"tmp-str-builder" : strbuilder,
+			"tmp-str-append" : strappend,
+			"tmp-str-join" : strjoin,
+		}
+		# temp funcs that are called with tokens instead of values
+		self.tmptokenfuncs = {"tmp-str-builder", "tmp-str-append", "tmp-str-join"}
+	def _displayfam (self, fam):
+		allon = 1
+		for m in self.ffams[fam]:
+			if m[0] == "!":
+				allon *= self._displayfam(m[1:])
+			else:
+				allon *= self.flags[m]
+		return allon
+	def _displayfams (self):
+		for fam in self.ffams:
+			output = {0:False, 1:True}[self._displayfam(fam)]
+			print(f"{fam} : {output}")
+	def _displayflags (self):
+		for name in self.flags:
+			passed = True
+			for rule in self.sfconfig:
+				t = rule[0]
+				c = rule[1]
+				if t == 1:
+					if c not in name:
+						passed = False
+						break
+				elif t == 2:
+					if c in name:
+						passed = False
+						break
+				elif t == 3:
+					if name[c[0]:c[1]] != c[2]:
+						passed = False
+						break
+				elif t == 4:
+					if name[c[0]:c[1]] == c[2]:
+						passed = False
+						break
+			if passed:
+				print(f"{name} : {self.flags[name]}")
+	def _flagshow (self, line):
+		line = line.lstrip().rstrip()
+		if line[line.index(" ")+1:].isalpha():
+			self.flags["showflags"] = eval(line[line.index(" ")+1])
+			return
+		self.sfconfig = eval(line[line.index(" ")+1:])
+	def _process_tmp_flags (self):
+		for name in self.flags:
+			if name[:3] != "tmp":
+				continue
+			if self.flags[name]:
+				fname = self.tmpnames[name]
+				self.builtins[fname] = self.tmpfuncs[name]
+				self.funcnames.append(fname)
+				if name in self.tmptokenfuncs:
+					self.tokenbuiltins.add(fname)
+	def _setupasync (self):
+		if not self.flags["async"]:
+			return
+		# asyncio is slow to import, so it is only imported by programs that run as tasks
+		import tasks
+		self.scheduler = tasks.Scheduler(self)
+		for name in self.scheduler.builtins:
+			self.builtins[name] = self.scheduler.builtins[name]
+			if name not in self.funcnames:
+				self.funcnames.append(name)
+	def _setfamily (self, line):
+		prop = line[2:line.index(" ")]
+		val = eval(line[line.index(" ")+1:])
+		if prop in self.ffams:
+			for pname in self.ffams[prop]:
+				if pname[0] == "!":
+					self._setfamily("#"+pname+" "+str(val))
+				else:
+					self.flags[pname] = val
+	def _setprop (self, line):
+		if line[1] == "!":
+			self._setfamily(line)
+			return
+		prop = line[1:line.index(" ")]
+		if prop == "showflags":
+			self._flagshow(line)
+			return
+		val = eval(line[line.index(" ")+1:])
+		if prop[0].islower():
+			if prop in self.flags:
+				self.flags[prop] = val
+	def _gettruth (self, name):
+		if name[0] != "!":
+			return self.flags[name]
+		for n in self.ffams[name]:
+			if n[0] == "!":
+				v = self._gettruth(n[1:])
+			else:
+				v = self.flags[n]
+			if not v:
+				return False
+		return True
+	def _toggleflag (self, name):
+		if name[0] == "!":
+			self._setfamily(f"#{name} {not self._gettruth(name)}")
+		else:
+			self.flags[name] = not self.flags[name]
+	# wraps the methods of each enabled trace category, nothing is wrapped when tracing is off so it costs nothing
+	def _setuptrace (self):
+		if not any(self.flags[name] for name in self.ffams["TRACE"]):
+			return
+		self.tracelog = collections.deque(maxlen=self.flags["tracesize"])
+		if self.flags["tracefile"] != None:
+			self.tracestream = open(self.flags["tracefile"], "a")
+		detail = self.flags["tracelevel"] > 1
+		if self.flags["trace-lex"]:
+			self.tokenize = self._traced("lex", self.tokenize, lambda line: repr(line), lambda tokens: str(tokens) if detail else None)
+		if self.flags["trace-eval"]:
+			self.runline = self._traced("eval", self.runline, lambda index, infunc=False: self.code[index].lstrip("\t"), None)
+			if detail:
+				self.evalnode = self._traced("eval", self.evalnode, lambda node, infunc=False: node[0], lambda token: str(token), 2)
+		if self.flags["trace-call"]:
+			self.runfunc = self._traced("call", self.runfunc, lambda fname, *args: f"{fname}({', '.join(str(arg) for arg in args)})", lambda token: str(token) if detail else None)
+		if self.flags["trace-loop"]:
+			self.loop = self._traced("loop", self.loop, lambda stmt, infunc=False: f"for {stmt[1]}", lambda ret: "end" if detail else None)
+			self.whileloop = self._traced("loop", self.whileloop, lambda stmt, infunc=False: "while", lambda ret: "end" if detail else None)
+	# returns a version of func that traces its arguments and, if after gives a message, its result
+	def _traced (self, category, func, before, after, level=1):
+		def traced (*args):
+			self.trace(category, level, before(*args))
+			value = func(*args)
+			if after != None:
+				message = after(value)
+				if message != None:
+					self.trace(category, level, message)
+			return value
+		return traced
+	def _setupprofile (self):
+		if not self.flags["profile"]:
+			return
+		self.runline = self._profiled("lines", self.runline)
+		self.runfunc = self._profiled("functions", self.runfunc)
+	# returns a version of func that profiles its runs, keyed by its first argument
+	def _profiled (self, kind, func):
+		def profiled (*args):
+			self.profilestart(kind, args[0])
+			try:
+				return func(*args)
+			finally:
+				self.profilestop(kind, args[0])
+		return profiled
+	# starts timing a run of a line or function
+	def profilestart (self, kind, key):
+		active = self.profileactive[kind]
+		active[key] = active.get(key, 0) + 1
+		self.profilestack[kind].append([time.perf_counter(), 0.0])
+	# stops timing the latest run of a line or function and records it
+	def profilestop (self, kind, key):
+		start, nested = self.profilestack[kind].pop()
+		elapsed = time.perf_counter() - start
+		stack = self.profilestack[kind]
+		if len(stack) > 0:
+			stack[-1][1] += elapsed
+		active = self.profileactive[kind]
+		active[key] -= 1
+		entry = self.profile[kind].setdefault(key, [0, 0.0, 0.0])
+		entry[0] += 1
+		if active[key] == 0:
+			entry[1] += elapsed
+		entry[2] += elapsed - nested
+	def _displayprofile (self):
+		size = self.flags["profilesize"]
+		# own time leaves out the time spent in nested lines or calls, the hottest are shown first
+		for kind in ("lines", "functions"):
+			print(f"{'own':>10} {'total':>10} {'count':>8}  {kind}")
+			for key, (count, total, own) in sorted(self.profile[kind].items(), key=lambda item: -item[1][2])[:size]:
+				name = f"{key}: {self.code[key].strip()}" if kind == "lines" else key
+				print(f"{own:>10.6f} {total:>10.6f} {count:>8}  {name}")
+		if self.flags["profilefile"] != None:
+			report = {
+				"lines" : [{"line" : index, "text" : self.code[index].strip(), "count" : count, "total" : total, "own" : own} for index, (count, total, own) in sorted(self.profile["lines"].items())],
+				"functions" : [{"name" : name, "count" : count, "total" : total, "own" : own} for name, (count, total, own) in sorted(self.profile["functions"].items())],
+			}
+			with open(self.flags["profilefile"], "w") as f:
+				json.dump(report, f, indent="\t")
+	# records a trace if its level is enabled
+	def trace (self, category, level, message):
+		if level > self.flags["tracelevel"]:
+			return
+		entry = f"[{category}] line {self.executionline}: {message}"
+		if self.tracestream != None:
+			self.tracestream.write(entry + "\n")
+		else:
+			self.tracelog.append(entry)
+	def listprops (self):
+		d = self.__dict__
+		for key in list(d.keys()):
+			print(key, d[key])
+	def ERROR (self, errorcode):
+		line = self.executionline
+		errinfo = f"Line: {line}: {self.code[line]}"
+		# error code for unclosed string
+		if errorcode == 0:
+			raise SyntaxError(f"{errinfo} Unclosed String")
+		# error code for unmatched parentheses
+		elif errorcode == 1:
+			raise SyntaxError(f"{errinfo} Unmatched Parentheses")
+		# error code for unmatched square brackets
+		elif errorcode == 2:
+			raise SyntaxError(f"{errinfo} Unmatched Square Brackets")
+		# error code for unmatched curly brackers
+		elif errorcode == 3:
+			raise SyntaxError(f"{errinfo} Unmatched Curly Brackets")
+		# error code for redundant function definition
+		elif errorcode == 4:
+			raise NameError(f"{errinfo} Function Already Defined")
+		# error code for attempting to set something other than a reference
+		elif errorcode == 5:
+			raise SyntaxError(f"{errinfo} Invalid Assignment")
+		# error code for undefined variable
+		elif errorcode == 6:
+			raise NameError(f"{errinfo} Undefined Variable Name")
+		# error code for unopened square bracket
+		elif errorcode == 7:
+			raise SyntaxError(f"{errinfo} Unopened Square Bracket")
+		# error code for unoped curly bracket
+		elif errorcode == 8:
+			raise SyntaxError(f"{errinfo} Unopened Curly Bracket")
+		# error code for invalid for loop parameters
+		elif errorcode == 9:
+			raise SyntaxError(f"{errinfo} Invalid For Loop Parameters")
+		# error code for a line that could not be compiled
+		elif errorcode == 10:
+			raise SyntaxError(f"{errinfo} Invalid Syntax")
+		# error code for subscripting something that isn't a string, list or dict
+		elif errorcode == 11:
+			raise TypeError(f"{errinfo} Invalid Subscripting Get Operation")
+	# splits the code into lines and indexes it in a single pass
+	def load (self, source):
+		"""
+		this function splits to code by newlines then joins the segments that were actually strings, this allows the programmer to use newlines within strings
+		as each line is finished it reads header flags, matches lines that open blocks to the lines that close them and hoists function definitions
+		a line opens a block if it ends with "{" and closes one if it starts with "}", so "} else {" does both, a comment at the end of the line doesn't count
+		"""
+		lines = []
+		self.tokencache = {}
+		self.nodecache = {}
+		self.blockends = {}
+		self.branches = {}
+		self.skiplines = set()
+		# lines with open blocks
+		stack = []
+		# the first word of each line that opens a block, ignoring a leading "}"
+		words = {}
+		# if the flags at the top of the program are still being read
+		inheader = True
+		# the segments of a string that contains newlines
+		pending = None
+		for line in source.split("\n"):
+			if pending != None:
+				pending.append(line)
+				if line.count('"') % 2 == 0:
+					continue
+				line = "\n".join(pending)
+				pending = None
+			elif line.count('"') % 2 != 0:
+				pending = [line]
+				continue
+			i = len(lines)
+			lines.append(line)
+			if inheader:
+				if len(line) > 0 and line[0] == "#":
+					self._setprop(line)
+					self.funclines.add(i)
+					self.skiplines.add(i)
+					continue
+				if line[:2] == "//":
+					self.funclines.add(i)
+					self.skiplines.add(i)
+					continue
+				inheader = False
+			text = stripcomment(line)
+			if text == "":
+				self.skiplines.add(i)
+				continue
+			if text[:1] == "}":
+				if len(stack) > 0:
+					opener = stack.pop()
+					self.blockends[opener] = i
+					if lines[opener][:5] == "func ":
+						self.hoistfunc(lines, opener, i)
+				text = text[1:].lstrip(" ")
+			if text[-1:] == "{":
+				stack.append(i)
+				words[i] = text.split(" ")[0].split("(")[0]
+		# a string that was never closed
+		if pending != None:
+			lines.append("\n".join(pending))
+		self._process_tmp_flags()
+		self._setupasync()
+		# an else or elif continues a chain either on the closing line of the previous branch or on the line right after it
+		for line in words:
+			if words[line] not in ("if", "elif") or line not in self.blockends:
+				continue
+			close = self.blockends[line]
+			if words.get(close) in ("elif", "else"):
+				self.branches[line] = close
+			elif stripcomment(lines[close]) == "}" and words.get(close+1) in ("elif", "else") and lines[close+1].strip(" \t")[:1] != "}":
+				self.branches[line] = close+1
+		# True, False and None are only constants if the program never assigns to them
+		self.constnames = {"True", "False", "None"}
+		self.constnames.difference_update(self.findlocals(line for line in lines if "True" in line or "False" in line or "None" in line))
+		return lines
+	# gets the tokens for a line of code, lexing the line only the first time it is requested
+	def linetokens (self, index):
+		if index not in self.tokencache:
+			self.tokencache[index] = self.tokenize(self.code[index].lstrip("\t"))
+		# evaluation modifies the token list in place so a copy is returned
+		return self.tokencache[index].copy()
+	# converts a line of code into a stream of tokens
+	def tokenize (self, line):
+		"""
+		tokenizes a line of code, each match of LEXER is one token, or whitespace, or the comment that ends the line
+		"""
+		tokens = []
+		for match in LEXER.finditer(line):
+			kind = match.lastgroup
+			part = match.group(kind)
+			if kind == "SPC":
+				continue
+			elif kind == "NAM":
+				# special cases for references
+				if part in self.funcnames:
+					tokens.append(Token(FUN, part))
+				elif part in self.statements:
+					tokens.append(Token(KEY, part))
+				else:
+					tokens.append(Token(REF, part))
+			elif kind == INT:
+				tokens.append(totoken(float(part) if "." in part else int(part)))
+			elif kind == STR:
+				part = part[1:-1]
+				# drops the backslashes from escaped characters
+				if "\\" in part:
+					part = ESCAPES.sub(r"\1", part)
+				tokens.append(Token(STR, part))
+			elif kind == "COM":
+				break
+			elif kind == "INC":
+				tokens.append(Token(ASS, part[0]+"="))
+				tokens.append(totoken(1))
+			elif kind == "UNC":
+				# raises an error if the string wasn't closed
+				self.ERROR(0)
+			elif kind == INV:
+				tokens.append(Token(INV, ""))
+			else:
+				tokens.append(Token(kind, part))
+		# returns the list of tokens
+		return tokens
+	def hoistclasses (self):
+		# start of class
+		start = 0
+		isclass = False
+		notclass = False
+		name = ""
+		args = []
+		for i in range(len(self.code)):
+			line = self.code[i]
+			if "class " in line:
+				if line.index("class ") == 0:
+					isclass = True
+					start = i+1
+					name = line[6:line.index("(")].rstrip()
+	# hoists a function definition given the lines of the program and the lines it starts and ends on
+	def hoistfunc (self, lines, start, end):
+		line = lines[start]
+		# gets the name
+		name = line[5:line.index("(")].rstrip()
+		# gets the args
+		args = line[line.index("(")+1:line.index(")")]
+		args = ''.join(args.split(" "))
+		args = args.split(",")
+		if args[0] == "":
+			args = []
+		# records the info about the function
+		self.funcs[name] = (start+1, end)
+		self.funcnames.append(name)
+		self.funcargs[name] = args
+		# gives each parameter and each name assigned in the body a slot in the function's frames
+		self.funcslots[name] = {}
+		for local in args + self.findlocals(lines[start+1:end]):
+			self.funcslots[name].setdefault(local, len(self.funcslots[name]))
+		self.framepool[name] = []
+		# marks the lines that are contained in the function
+		self.funclines.update(range(start, end+1))
+		for i in range(start, end+1):
+			self.linefuncs[i] = name
+	# finds the names that are assigned in some lines, either by an assignment, by "++" or "--" or by a for loop
+	def findlocals (self, lines):
+		names = []
+		for line in lines:
+			parts = []
+			for match in LEXER.finditer(line):
+				kind = match.lastgroup
+				if kind == "COM":
+					break
+				if kind != "SPC":
+					parts.append((kind, match.group(kind)))
+			for i in range(len(parts)-1):
+				if parts[i][0] != "NAM":
+					continue
+				if parts[i+1][0] in ("ASS", "INC"):
+					names.append(parts[i][1])
+				elif parts[i][1] == "for" and parts[i+1][0] == "NAM":
+					names.append(parts[i+1][1])
+		return names
+	# gets the line that closes the block opened on a line
+	def blockend (self, line):
+		if line not in self.blockends:
+			self.ERROR(3)
+		return self.blockends[line]
+	# gets the compiled form of a line of code, compiling the line only the first time it is requested
+	def linenode (self, index):
+		if index not in self.nodecache:
+			if index in self.skiplines:
+				return ("NOP",)
+			stmt = self.compileline(self.linetokens(index))
+			# lines in a function read and write its locals by slot
+			if index in self.linefuncs:
+				stmt = self.resolvelocals(stmt, self.funcslots[self.linefuncs[index]])
+			if self.flags["fold"]:
+				stmt = self.foldstmt(index, stmt)
+			self.nodecache[index] = stmt
+		return self.nodecache[index]
+	# compiles every line before the program runs so that constants are folded and dead branches are dropped up front, and so the compiled lines can be cached
+	def optimize (self):
+		for i in range(len(self.code)):
+			if i in self.skiplines or self.code[i][:5] == "func ":
+				continue
+			self.executionline = i
+			# lines that don't compile raise their error if they are run
+			try:
+				self.linenode(i)
+			except Exception:
+				continue
+		self.executionline = 0
+	# folds the constant expressions in a compiled statement and drops the parts of the program it makes unreachable
+	def foldstmt (self, index, stmt):
+		stmt = tuple(self.foldnode(item) if type(item) == tuple else item for item in stmt)
+		kind = stmt[0]
+		# an expression without side effects does nothing
+		if kind == "EXP" and stmt[1][0] in ("CON", "NEW"):
+			self.tracefold(f"dropped {self.code[index].strip()}")
+			return ("NOP",)
+		if kind not in ("if", "elif", "while") or stmt[1][0] not in ("CON", "NEW") or stmt[1][1].value:
+			return stmt
+		# the block of a branch or loop that is never taken never runs, lines that open or close blocks are kept so the structure of the program is unchanged
+		if index in self.blockends:
+			dropped = 0
+			for i in range(index+1, self.blockends[index]):
+				if i not in self.blockends and self.code[i].strip(" \t")[:1] != "}" and i not in self.skiplines:
+					self.skiplines.add(i)
+					dropped += 1
+			self.tracefold(f"dropped {dropped} lines after {self.code[index].strip()}")
+		return stmt
+	# folds the constant parts of a compiled expression
+	def foldnode (self, node):
+		# tuples of nodes, the arguments of a call, the items of a list or the pairs of a dict
+		if len(node) == 0 or type(node[0]) == tuple:
+			return tuple(self.foldnode(item) for item in node)
+		kind = node[0]
+		if kind == REF and node[1] in self.constnames:
+			return ("CON", self.vars[node[1]])
+		if kind in ("CON", "NEW", REF, "LOC"):
+			return node
+		node = tuple(self.foldnode(item) if type(item) == tuple else item for item in node)
+		if kind in (MAT, LOG, EQU):
+			parts = node[2:]
+		elif kind == SQU:
+			parts = node[1:]
+		elif kind == LST:
+			parts = node[1]
+		elif kind == DCT:
+			parts = [part for pair in node[1] for part in pair]
+		else:
+			return node
+		if not all(part == None or part[0] in ("CON", "NEW") for part in parts):
+			return node
+		# operations that fail are left for the program to raise when it runs them
+		try:
+			token = self.evalnode(node)
+		except Exception:
+			return node
+		self.tracefold(f"{kind} {node[1]} -> {token}" if kind in (MAT, LOG, EQU) else f"{kind} -> {token}")
+		if token.type in (LST, DCT):
+			values = token.value if token.type == LST else token.value.values()
+			return ("NEW", token, any(type(value) in (list, dict) for value in values))
+		return ("CON", token)
+	# reports a change made by folding
+	def tracefold (self, message):
+		if self.flags["trace-fold"]:
+			self.trace("fold", 1, message)
+	# replaces the references to locals in a compiled statement or node with their slots
+	def resolvelocals (self, node, slots):
+		# tuples of nodes, the arguments of a call, the items of a list or the pairs of a dict
+		if len(node) == 0 or type(node[0]) == tuple:
+			return tuple(self.resolvelocals(item, slots) for item in node)
+		kind = node[0]
+		if kind == REF and node[1] in slots:
+			return ("LOC", slots[node[1]], node[1])
+		final = [kind]
+		for item in node[1:]:
+			if type(item) == tuple:
+				item = self.resolvelocals(item, slots)
+			final.append(item)
+		if kind == ASS and node[2] in slots:
+			final[4] = slots[node[2]]
+		elif kind == "for" and node[1] in slots:
+			final[5] = slots[node[1]]
+		return tuple(final)
+	# compiles the tokens of a line into a statement
+	def compileline (self, tokens):
+		"""
+		statements are tuples of the form (kind, ...), where kind is a keyword, "EXP" for an expression or "NOP" for a line that does nothing
+		"""
+		tokens = self.cleantokens(tokens)
+		# drops the bracket closing a previous block, this allows "} else {" and "} elif (...) {"
+		if len(tokens) > 0 and tokens[0].type == CUR and tokens[0].value == "}":
+			tokens = tokens[1:]
+		if len(tokens) == 0:
+			return ("NOP",)
+		first = tokens[0]
+		if first.type == KEY:
+			key = first.value
+			# drops the bracket opening the block
+			if tokens[-1].type == CUR and tokens[-1].value == "{":
+				tokens = tokens[:-1]
+			if key in ("if", "elif", "while"):
+				return (key, self.compileexpr(tokens[1:]))
+			elif key == "else":
+				return ("else",)
+			elif key == "return":
+				if len(tokens) == 1:
+					return ("return", None)
+				return ("return", self.compileexpr(tokens[1:]))
+			elif key == "for":
+				return self.compilefor(tokens)
+			self.ERROR(10)
+		if first.type == REF and len(tokens) == 1 and first.value in ("break", "continue"):
+			return (first.value,)
+		if len(tokens) == 3 and tokens[1].type == KEY and tokens[1].value == "alias":
+			return ("alias", tokens[0].value, tokens[2].value)
+		return ("EXP", self.compileexpr(tokens))
+	# compiles the parameters of a for loop
+	def compilefor (self, tokens):
+		if len(tokens) < 4 or tokens[1].type != REF:
+			self.ERROR(9)
+		# "for x in collection", the collection is kept where the start of a range goes and the end is None
+		if tokens[2].type == KEY and tokens[2].value == "in":
+			return ("for", tokens[1].value, self.compileexpr(tokens[3:]), None, None, None)
+		if tokens[2].type != PAR or tokens[2].value != "(":
+			self.ERROR(9)
+		params = []
+		pos = 3
+		while len(params) < 3:
+			if pos >= len(tokens):
+				self.ERROR(9)
+			node, pos = self.parseexpr(tokens, pos)
+			params.append(node)
+			if pos >= len(tokens):
+				self.ERROR(9)
+			token = tokens[pos]
+			if len(params) < 3 and (token.type != SEP or token.value != ","):
+				self.ERROR(9)
+			pos += 1
+		if tokens[pos-1].type != PAR or tokens[pos-1].value != ")" or pos != len(tokens):
+			self.ERROR(9)
+		return ("for", tokens[1].value, params[0], params[1], params[2], None)
+	# drops invalid tokens and splits negative numbers that directly follow a value into a subtraction, as in "x -1"
+	def cleantokens (self, tokens):
+		final = []
+		for token in tokens:
+			if token.type == INV:
+				continue
+			if token.type == INT and token.value < 0 and len(final) > 0:
+				last = final[-1]
+				if last.type in (INT, STR, LIT, REF) or (last.type in (PAR, SQU, CUR) and last.value in ")]}"):
+					final.append(Token(MAT, "-"))
+					token = totoken(-token.value)
+			final.append(token)
+		return final
+	# compiles a complete expression
+	def compileexpr (self, tokens):
+		tokens = self.cleantokens(tokens)
+		if len(tokens) == 0:
+			self.ERROR(10)
+		node, pos = self.parseexpr(tokens, 0)
+		if pos != len(tokens):
+			self.ERROR(10)
+		return node
+	# parses binary operators with a binding power of at least minprec, returns the node and the position after it
+	def parseexpr (self, tokens, pos, minprec=1):
+		node, pos = self.parseunary(tokens, pos)
+		while pos < len(tokens):
+			token = tokens[pos]
+			if token.type == ASS:
+				# assignment binds the loosest and groups to the right
+				if minprec > 1:
+					break
+				if node[0] != REF:
+					self.ERROR(5)
+				value, pos = self.parseexpr(tokens, pos+1)
+				node = (ASS, token.value, node[1], value, None)
+				continue
+			if token.type not in (MAT, LOG, EQU) or token.value == "!":
+				break
+			prec = PRECEDENCE[token.value]
+			if prec < minprec:
+				break
+			right, pos = self.parseexpr(tokens, pos+1, prec+1)
+			node = (token.type, token.value, node, right)
+		return node, pos
+	# parses prefix operators
+	def parseunary (self, tokens, pos):
+		if pos >= len(tokens):
+			self.ERROR(10)
+		token = tokens[pos]
+		if token.type == LOG and token.value == "!":
+			node, pos = self.parseexpr(tokens, pos+1, PRECEDENCE["!"])
+			return (LOG, "!", None, node), pos
+		if token.type == MAT and token.value == "-":
+			node, pos = self.parseunary(tokens, pos+1)
+			return (MAT, "-", None, node), pos
+		return self.parsepostfix(tokens, pos)
+	# parses a value followed by any number of subscripts
+	def parsepostfix (self, tokens, pos):
+		node, pos = self.parseprimary(tokens, pos)
+		while pos < len(tokens) and tokens[pos].type == SQU and tokens[pos].value == "[":
+			index, pos = self.parseexpr(tokens, pos+1)
+			if pos >= len(tokens) or tokens[pos].value != "]":
+				self.ERROR(2)
+			node = (SQU, node, index)
+			pos += 1
+		return node, pos
+	# parses a single value, a call, a bracketed expression or a list or dict literal
+	def parseprimary (self, tokens, pos):
+		token = tokens[pos]
+		if token.type in (INT, STR, LIT):
+			return ("CON", token), pos+1
+		elif token.type == REF:
+			return (REF, token.value), pos+1
+		elif token.type == FUN:
+			if pos+1 < len(tokens) and tokens[pos+1].type == PAR and tokens[pos+1].value == "(":
+				args, pos = self.parseitems(tokens, pos+2, PAR, ")", 1)
+				star = any(arg[0] == "STA" for arg in args)
+				return (FUN, token.value, tuple(args), star), pos
+			return ("CON", token), pos+1
+		elif token.type == PAR and token.value == "(":
+			node, pos = self.parseexpr(tokens, pos+1)
+			if pos >= len(tokens) or tokens[pos].type != PAR or tokens[pos].value != ")":
+				self.ERROR(1)
+			return node, pos+1
+		elif token.type == SQU and token.value == "[":
+			items, pos = self.parseitems(tokens, pos+1, SQU, "]", 2)
+			return (LST, tuple(items)), pos
+		elif token.type == CUR and token.value == "{":
+			items, pos = self.parseitems(tokens, pos+1, CUR, "}", 3, True)
+			return (DCT, tuple(items)), pos
+		elif token.type == SQU and token.value == "]":
+			self.ERROR(7)
+		elif token.type == CUR and token.value == "}":
+			self.ERROR(8)
+		self.ERROR(10)
+	# parses comma seperated items up to the closing bracket, returns the items and the position after the bracket
+	def parseitems (self, tokens, pos, type, closer, errorcode, pairs=False):
+		items = []
+		while True:
+			if pos >= len(tokens):
+				self.ERROR(errorcode)
+			token = tokens[pos]
+			if token.type == type and token.value == closer:
+				return items, pos+1
+			if len(items) > 0:
+				if token.type != SEP:
+					self.ERROR(errorcode)
+				pos += 1
+				if pos >= len(tokens):
+					self.ERROR(errorcode)
+			# star arguments, only used by function calls
+			if type == PAR and tokens[pos].type == MAT and tokens[pos].value == "*":
+				node, pos = self.parseexpr(tokens, pos+1)
+				items.append(("STA", node))
+				continue
+			node, pos = self.parseexpr(tokens, pos)
+			if pairs:
+				if pos >= len(tokens) or tokens[pos].type != SYM or tokens[pos].value != ":":
+					self.ERROR(errorcode)
+				value, pos = self.parseexpr(tokens, pos+1)
+				node = (node, value)
+			items.append(node)
+	# evaluates a compiled expression, returns a token
+	def evalnode (self, node, infunc=False):
+		return self.nodeops[node[0]](node, infunc)
+	def loop (self, stmt, infunc=False):
+		loopvarname, slot = stmt[1], stmt[5]
+		if stmt[3] == None:
+			values = self.loopvalues(self.evalnode(stmt[2], infunc).detokenize())
+		else:
+			loopstart = self.evalnode(stmt[2], infunc).detokenize()
+			loopend = self.evalnode(stmt[3], infunc).detokenize()
+			loopstep = self.evalnode(stmt[4], infunc).detokenize()
+			values = range(loopstart, loopend, loopstep)
+		startline = self.executionline + 1
+		endline = self.blockend(self.executionline)
+		for loop in values:
+			if slot == None:
+				self.vars[loopvarname] = totoken(loop)
+			else:
+				self.frame[slot] = totoken(loop)
+			self.executionline = startline
+			v, val = self.looppass(endline, infunc)
+			if v == 1:
+				break
+			elif v == 3:
+				return 3, val
+		self.executionline = endline
+		return 0, None
+	# iterates over the collection of a for in loop without copying it, lists and strings give their items, dicts give their keys
+	def loopvalues (self, collection):
+		try:
+			return iter(collection)
+		except TypeError:
+			self.ERROR(9)
+	def whileloop (self, stmt, infunc=False):
+		line = self.executionline
+		endline = self.blockend(line)
+		while self.evalnode(stmt[1], infunc):
+			self.executionline = line + 1
+			v, val = self.looppass(endline, infunc)
+			if v == 1:
+				break
+			elif v == 3:
+				return 3, val
+		self.executionline = endline
+		return 0, None
+	# runs the body of a loop once, returns 1 for break, 2 for continue and 3 along with the value for return
+	def looppass (self, endline, infunc=False):
+		while self.executionline < endline:
+			ret, val = self.runline(self.executionline, infunc)
+			if ret:
+				return ret, val
+			self.executionline += 1
+		return 0, None
+	def doCON (self, node, infunc=False):
+		return node[1]
+	def doNEW (self, node, infunc=False):
+		token = node[1]
+		if node[2]:
+			return Token(token.type, copy.deepcopy(token.value))
+		return Token(token.type, token.value.copy())
+	def doREF (self, node, infunc=False):
+		v = node[1]
+		if v in self.vars:
+			return self.vars[v]
+		self.ERROR(6)
+	def doLOC (self, node, infunc=False):
+		value = self.frame[node[1]]
+		# a local that hasn't been assigned yet reads the global with the same name
+		if value == None:
+			return self.doREF((REF, node[2]), infunc)
+		return value
+	def doFUN (self, node, infunc=False):
+		if not node[3]:
+			return self.runfunc(node[1], *[self.evalnode(arg, infunc) for arg in node[2]])
+		args = []
+		for arg in node[2]:
+			if arg[0] == "STA":
+				args.extend(map(totoken, self.evalnode(arg[1], infunc).detokenize()))
+			else:
+				args.append(self.evalnode(arg, infunc))
+		return self.runfunc(node[1], *args)
+	def doSQU (self, node, infunc=False):
+		# list literal
+		if node[0] == LST:
+			final = []
+			for item in node[1]:
+				final.append(self.evalnode(item, infunc).detokenize())
+			return Token(LST, final)
+		# subscript
+		target = self.evalnode(node[1], infunc)
+		ind = self.evalnode(node[2], infunc).detokenize()
+		if target.type not in SUBSCRIPT:
+			self.ERROR(11)
+		return totoken(target[ind])
+	def doCUR (self, node, infunc=False):
+		final = {}
+		for key, value in node[1]:
+			final[self.evalnode(key, infunc).detokenize()] = self.evalnode(value, infunc).detokenize()
+		return Token(DCT, final)
+	def doASS (self, node, infunc=False):
+		v, name, slot = node[1], node[2], node[4]
+		value = self.evalnode(node[3], infunc)
+		if slot == None:
+			if v == "+=":
+				value = addto(self.doREF((REF, name), infunc), value)
+			elif v != "=":
+				value = totoken(MATOPS[v[0]](self.doREF((REF, name), infunc).detokenize(), value.detokenize()))
+			self.vars[name] = value
+		else:
+			if v == "+=":
+				value = addto(self.doLOC(("LOC", slot, name), infunc), value)
+			elif v != "=":
+				value = totoken(MATOPS[v[0]](self.doLOC(("LOC", slot, name), infunc).detokenize(), value.detokenize()))
+			self.frame[slot] = value
+		return value
+	# returns 0 normally, 1 for break, 2 for continue and 3 along with the value for return
+	def doKEY (self, stmt, infunc=False):
+		key = stmt[0]
+		if key == "alias":
+			self.funcaliases[stmt[2]] = stmt[1]
+			self.funcnames.append(stmt[2])
+			# lines already compiled may have the alias as a reference instead of a function
+			self.tokencache = {}
+			self.nodecache = {}
+		elif key == "return":
+			value = NONE if stmt[1] == None else self.evalnode(stmt[1], infunc)
+			# a return outside of a function does nothing, even inside a loop, like it does in the bytecode
+			if not infunc:
+				return 0, None
+			return 3, value
+		elif key == "break":
+			return 1, None
+		elif key == "continue":
+			return 2, None
+		elif key == "for":
+			return self.loop(stmt, infunc)
+		elif key == "while":
+			return self.whileloop(stmt, infunc)
+		# reaching an else or elif means an earlier branch ran, so the rest of the chain is skipped
+		elif key in ("else", "elif"):
+			line = self.executionline
+			while line in self.branches:
+				line = self.branches[line]
+			self.executionline = self.blockend(line)
+		elif key == "if":
+			line = self.executionline
+			while not self.evalnode(stmt[1], infunc):
+				# skips to the next branch or past the end of the chain
+				if line not in self.branches:
+					self.executionline = self.blockend(line)
+					break
+				line = self.branches[line]
+				self.executionline = line
+				stmt = self.linenode(line)
+				if stmt[0] == "else":
+					break
+		return 0, None
+	def doMAT (self, node, infunc=False):
+		v = node[1]
+		# negation
+		if node[2] == None:
+			return totoken(-self.evalnode(node[3], infunc).detokenize())
+		left = self.evalnode(node[2], infunc).detokenize()
+		right = self.evalnode(node[3], infunc).detokenize()
+		return totoken(MATOPS[v](left, right))
+	def doLOG (self, node, infunc=False):
+		v = node[1]
+		if v == "!":
+			return totoken(not self.evalnode(node[3], infunc).detokenize())
+		v1 = self.evalnode(node[2], infunc).detokenize()
+		# "&" and "|" only evaluate the right side when it decides the result
+		if v == "&":
+			if not v1:
+				return totoken(v1)
+			return totoken(self.evalnode(node[3], infunc).detokenize())
+		elif v == "|":
+			if v1:
+				return totoken(v1)
+			return totoken(self.evalnode(node[3], infunc).detokenize())
+		v2 = self.evalnode(node[3], infunc).detokenize()
+		if v == "^":
+			value = v1 ^ v2
+		elif v == "%":
+			value = v1 % v2
+		return totoken(value)
+	def doEQU (self, node, infunc=False):
+		v1 = self.evalnode(node[2], infunc).detokenize()
+		v2 = self.evalnode(node[3], infunc).detokenize()
+		return totoken(EQUOPS[node[1]](v1, v2))
+	def runline (self, index, infunc=False):
+		stmt = self.linenode(index)
+		if stmt[0] == "EXP":
+			self.evalnode(stmt[1], infunc)
+			return 0, None
+		elif stmt[0] == "NOP":
+			return 0, None
+		return self.doKEY(stmt, infunc)
+	# calls a function
+	def runfunc (self, fname, *args):
+		stored = self.executionline
+		# checks if the function name is an alias
+		if fname not in self.funcs and fname in self.funcaliases:
+			fname = self.funcaliases[fname]
+		# checks if fname was translated into a python function, a call with missing arguments runs line by line so that they read the globals
+		if fname in self.nativefuncs and len(args) >= len(self.funcargs[fname]):
+			return totoken(self.nativefuncs[fname](*[arg.value for arg in args]))
+		# checks if fname is a builtin function
+		if fname not in self.funcs:
+			# checks that fname is valid
+			if fname not in self.builtins:
+				raise NameError("function not defined")
+			# runs the function with the args converted from tokens to standard data types, args are always evaluated so they hold their values directly
+			if fname in self.tokenbuiltins:
+				return totoken(self.builtins[fname](*args))
+			v = self.builtins[fname](*[arg.value for arg in args])
+			# returns the output of the function as a token, a builtin that returns nothing gives None
+			return totoken(v)
+		# function defined in the script
+		else:
+			# each call runs through several python calls, so deep calls run as bytecode before they reach python's recursion limit
+			if (self.depth >= self.flags["linedepth"] or self.stackfull()) and self.vmprogram():
+				return self.runvm(fname, args)
+			# gives the call its own frame, the caller's frame is restored when it returns
+			caller, callerslots = self.frame, self.slots
+			self.frame, self.slots = self.newframe(fname, args), self.funcslots[fname]
+			# runs the function
+			start, end = self.funcs[fname]
+			self.executionline = start
+			self.depth += 1
+			try:
+				while self.executionline < end:
+					ret, val = self.runline(self.executionline, True)
+					if ret == 3:
+						return val
+					self.executionline += 1
+				# a function that runs off its end returns None
+				return NONE
+			finally:
+				self.depth -= 1
+				self.freeframe(fname, self.frame)
+				self.frame, self.slots = caller, callerslots
+				self.executionline = stored
+	# whether python's stack is close to the recursion limit, loops, blocks and instrumentation nest python calls that depth doesn't count
+	def stackfull (self):
+		try:
+			sys._getframe(sys.getrecursionlimit() - STACKRESERVE)
+		except ValueError:
+			return False
+		return True
+	# compiles the program the first time a call is run as bytecode, a program that can't be compiled keeps running line by line
+	def vmprogram (self):
+		if self.program == None:
+			line = self.executionline
+			try:
+				self.program = self.compileprogram()
+			except Exception:
+				self.program = False
+			self.executionline = line
+		return self.program
+	# takes a frame for a call to a function from its pool and fills in the arguments, extra arguments are ignored
+	def newframe (self, fname, args):
+		pool = self.framepool[fname]
+		if len(pool) > 0:
+			frame = pool.pop()
+		else:
+			frame = [None] * len(self.funcslots[fname])
+		for i in range(min(len(args), len(self.funcargs[fname]))):
+			frame[i] = args[i]
+		return frame
+	# clears a frame so that it doesn't keep its values alive and returns it to the function's pool
+	def freeframe (self, fname, frame):
+		frame[:] = (None,) * len(frame)
+		self.framepool[fname].append(frame)
+	# finds lines that create aliases so that the names are lexed as functions before the program is compiled
+	def prescanaliases (self):
+		found = False
+		for i in range(len(self.code)):
+			if " alias " not in self.code[i]:
+				continue
+			tokens = self.cleantokens(self.tokenize(self.code[i].lstrip("\t")))
+			if len(tokens) == 3 and tokens[1].type == KEY and tokens[1].value == "alias":
+				self.funcnames.append(tokens[2].value)
+				found = True
+		if found:
+			self.tokencache = {}
+			self.nodecache = {}
+	# compiles the whole program into bytecode
+	def compileprogram (self):
+		"""
+		returns the list of instructions and a dict mapping function names to the position of their first instruction, the program starts at position 0
+		"""
+		self.prescanaliases()
+		ops = []
+		funcops = []
+		entries = {}
+		pos = 0
+		while pos < len(self.code):
+			pos = self.compileblock(pos, ops, funcops, entries, False, None)
+			# skips a stray closing bracket
+			pos += 1
+		ops.append((HALT, None))
+		# function bodies are placed after the main program
+		offset = len(ops)
+		for op, arg in funcops:
+			if op in (JUMP, JUMPF, JUMPFK, JUMPTK):
+				arg += offset
+			elif op == FORITER:
+				arg = (arg[0], arg[1], arg[2] + offset, arg[3] + offset)
+			ops.append((op, arg))
+		for name in entries:
+			entries[name] += offset
+		return ops, entries
+	# compiles lines until the line that closes the current block, returns the position of that line
+	def compileblock (self, pos, ops, funcops, entries, infunc, loop):
+		"""
+		loop is None outside of loops, otherwise it is a tuple of the lists of positions of break and continue jumps that need to be patched
+		"""
+		while pos < len(self.code):
+			text = self.code[pos].lstrip("\t")
+			# header flags, comments and blank lines are in skiplines and compile to nothing, a "#" line after the header is an error like in the line by line interpreter
+			if pos in self.skiplines:
+				pos += 1
+				continue
+			if text[:5] == "func ":
+				pos = self.compilefuncdef(pos, funcops, entries) + 1
+				continue
+			if len(text) > 0 and text[0] == "}":
+				return pos
+			self.executionline = pos
+			stmt = self.linenode(pos)
+			kind = stmt[0]
+			if kind == "NOP":
+				pos += 1
+				continue
+			ops.append((LINE, pos))
+			# an assignment on its own line stores its value without leaving a copy to pop
+			if kind == "EXP" and stmt[1][0] == ASS:
+				self.compileassign(stmt[1], ops, infunc)
+			elif kind == "EXP":
+				self.compilenode(stmt[1], ops, infunc)
+				ops.append((POP, None))
+			elif kind == "return":
+				node = stmt[1]
+				if node == None:
+					ops.append((PUSH, NONE))
+				# a call to a script function that is returned reuses the returning function's place on the stack of calls
+				elif infunc and node[0] == FUN and not node[3] and node[1] in self.funcs:
+					for arg in node[2]:
+						self.compilenode(arg, ops, infunc)
+					ops.append((TAILCALL, (node[1], len(node[2]))))
+				else:
+					self.compilenode(node, ops, infunc)
+				# a return outside of a function does nothing, even inside a loop, its value is still worked out
+				ops.append((RET if infunc else POP, None))
+			elif kind == "alias":
+				ops.append((ALIAS, (stmt[1], stmt[2])))
+			elif kind == "break":
+				if loop != None:
+					loop[0].append(len(ops))
+					ops.append((JUMP, None))
+			elif kind == "continue":
+				if loop != None:
+					loop[1].append(len(ops))
+					ops.append((JUMP, None))
+			elif kind == "if":
+				pos = self.compileif(pos, stmt, ops, funcops, entries, infunc, loop)
+			elif kind in ("elif", "else"):
+				# an else that isn't part of an if chain is skipped, the same as the line interpreter
+				skip = len(ops)
+				ops.append((JUMP, None))
+				pos = self.compileblock(pos+1, ops, funcops, entries, infunc, loop)
+				ops[skip] = (JUMP, len(ops))
+			elif kind == "while":
+				top = len(ops)
+				self.compilenode(stmt[1], ops, infunc)
+				exit = len(ops)
+				ops.append((JUMPF, None))
+				inner = ([], [])
+				pos = self.compileblock(pos+1, ops, funcops, entries, infunc, inner)
+				ops.append((JUMP, top))
+				ops[exit] = (JUMPF, len(ops))
+				self.patchloop(ops, inner, len(ops), top)
+			elif kind == "for":
+				if stmt[3] == None:
+					self.compilenode(stmt[2], ops, infunc)
+					ops.append((ITER, None))
+				else:
+					for node in stmt[2:5]:
+						self.compilenode(node, ops, infunc)
+					ops.append((RANGE, None))
+				top = len(ops)
+				ops.append((FORITER, None))
+				inner = ([], [])
+				pos = self.compileblock(pos+1, ops, funcops, entries, infunc, inner)
+				bottom = len(ops)
+				ops.append((FORITER, None))
+				# break leaves the iterator on the stack
+				brk = len(ops)
+				ops.append((POP, None))
+				ops[top] = ops[bottom] = (FORITER, (stmt[1], stmt[5], len(ops), top + 1))
+				self.patchloop(ops, inner, brk, bottom)
+			pos += 1
+		return pos
+	# compiles an if statement along with its elif and else branches, returns the position of the last closing bracket
+	def compileif (self, pos, stmt, ops, funcops, entries, infunc, loop):
+		ends = []
+		while True:
+			self.compilenode(stmt[1], ops, infunc)
+			skip = len(ops)
+			ops.append((JUMPF, None))
+			close = self.compileblock(pos+1, ops, funcops, entries, infunc, loop)
+			if pos not in self.branches:
+				ops[skip] = (JUMPF, len(ops))
+				pos = close
+				break
+			pos = self.branches[pos]
+			ends.append(len(ops))
+			ops.append((JUMP, None))
+			ops[skip] = (JUMPF, len(ops))
+			stmt = self.linenode(pos)
+			if stmt[0] == "elif":
+				ops.append((LINE, pos))
+				continue
+			pos = self.compileblock(pos+1, ops, funcops, entries, infunc, loop)
+			break
+		for end in ends:
+			ops[end] = (JUMP, len(ops))
+		return pos
+	# points the break and continue jumps of a loop at their targets
+	def patchloop (self, ops, loop, brk, cnt):
+		for i in loop[0]:
+			ops[i] = (JUMP, brk)
+		for i in loop[1]:
+			ops[i] = (JUMP, cnt)
+	# compiles a function definition into funcops, returns the position of its closing bracket
+	def compilefuncdef (self, pos, funcops, entries):
+		line = self.code[pos].lstrip("\t")
+		name = line[5:line.index("(")].rstrip()
+		entries[name] = len(funcops)
+		pos = self.compileblock(pos+1, funcops, funcops, entries, True, None)
+		funcops.append((PUSH, NONE))
+		funcops.append((RET, None))
+		return pos
+	# compiles an expression, the instructions leave its value on the stack
+	def compilenode (self, node, ops, infunc):
+		kind = node[0]
+		if kind == "CON":
+			ops.append((PUSH, node[1]))
+		elif kind == "NEW":
+			ops.append((NEW, node[1:]))
+		elif kind == REF:
+			ops.append((LOAD, node[1]))
+		elif kind == "LOC":
+			ops.append((LOADF, (node[1], node[2])))
+		elif kind in (MAT, EQU) or (kind == LOG and node[1] in "^%"):
+			if node[2] == None:
+				self.compilenode(node[3], ops, infunc)
+				ops.append((NEG, None))
+				return
+			self.compilenode(node[2], ops, infunc)
+			func, right = BINOPS[node[1]], node[3]
+			# the right side is combined in the same instruction when it is a constant or a variable
+			if right[0] == "CON":
+				ops.append((BINC, (func, right[1].value)))
+			elif right[0] == REF:
+				ops.append((BINL, (func, right[1])))
+			elif right[0] == "LOC":
+				ops.append((BINLF, (func, right[1], right[2])))
+			else:
+				self.compilenode(right, ops, infunc)
+				ops.append((BIN, func))
+		elif kind == LOG:
+			if node[1] == "!":
+				self.compilenode(node[3], ops, infunc)
+				ops.append((NOT, None))
+				return
+			self.compilenode(node[2], ops, infunc)
+			skip = len(ops)
+			ops.append((None, None))
+			self.compilenode(node[3], ops, infunc)
+			ops[skip] = (JUMPFK if node[1] == "&" else JUMPTK, len(ops))
+		elif kind == ASS:
+			# an assignment used as a value leaves the value that was assigned
+			if node[1] == "=":
+				self.compilenode(node[3], ops, infunc)
+				ops.append((DUP, None))
+				ops.append((STORE, node[2]) if node[4] == None else (STOREF, node[4]))
+			else:
+				self.compileassign(node, ops, infunc)
+				ops.append((LOAD, node[2]) if node[4] == None else (LOADF, (node[4], node[2])))
+		elif kind == FUN:
+			args = node[2]
+			if not node[3]:
+				for arg in args:
+					self.compilenode(arg, ops, infunc)
+				ops.append((CALL, (node[1], len(args))))
+				return
+			ops.append((NEWARGS, None))
+			for arg in args:
+				if arg[0] == "STA":
+					self.compilenode(arg[1], ops, infunc)
+					ops.append((EXTEND, None))
+				else:
+					self.compilenode(arg, ops, infunc)
+					ops.append((APPEND, None))
+			ops.append((CALLS, node[1]))
+		elif kind == LST:
+			for item in node[1]:
+				self.compilenode(item, ops, infunc)
+			ops.append((MKLST, len(node[1])))
+		elif kind == DCT:
+			for key, value in node[1]:
+				self.compilenode(key, ops, infunc)
+				self.compilenode(value, ops, infunc)
+			ops.append((MKDCT, len(node[1])))
+		elif kind == SQU:
+			self.compilenode(node[1], ops, infunc)
+			self.compilenode(node[2], ops, infunc)
+			ops.append((INDEX, None))
+	# compiles an assignment that leaves nothing on the stack, the value is worked out before the variable is read like it is line by line
+	def compileassign (self, node, ops, infunc):
+		v, name, slot = node[1], node[2], node[4]
+		self.compilenode(node[3], ops, infunc)
+		if v == "=":
+			ops.append((STORE, name) if slot == None else (STOREF, slot))
+			return
+		func = None if v == "+=" else MATOPS[v[0]]
+		ops.append((AUG, (func, name)) if slot == None else (AUGF, (func, slot, name)))
+	# pops n values off of the stack
+	def popvalues (self, stack, n):
+		if n == 0:
+			return []
+		values = stack[-n:]
+		del stack[-n:]
+		return values
+	# runs the program as bytecode
+	def runvm (self, fname=None, args=()):
+		"""
+		runs the program as bytecode, or when fname is given runs a call to that function for the line by line interpreter and returns its value
+		the instructions are tested in roughly the order of how often they run, the ones that run on every line and in every loop come first
+		"""
+		if fname == None:
+			self.program = self.compileprogram()
+		ops, entries = self.program
+		tracecall = self.flags["trace-call"]
+		traceloop = self.flags["trace-loop"]
+		profile = self.flags["profile"]
+		# the line being profiled
+		profiled = None
+		stack = []
+		push, pop = stack.append, stack.pop
+		# globals never change dict, the frame is kept in a local and in self.frame, calls from here into python always put self.frame back before they return
+		variables = self.vars
+		# builtins are called without going through runfunc, unless runfunc is wrapped to trace or profile them or they take tokens
+		builtins = {} if tracecall or profile else {name : self.builtins[name] for name in self.builtins if name not in self.tokenbuiltins}
+		# return position, caller frame, caller slots, caller line, the name of the function called and the size of the stack when it was called for each active call
+		frames = []
+		pc = 0
+		# a call from the line by line interpreter returns to python, its position is None, it was already profiled by runfunc
+		if fname != None:
+			frames.append((None, self.frame, self.slots, self.executionline, fname, 0))
+			self.frame, self.slots = self.newframe(fname, args), self.funcslots[fname]
+			pc = entries[fname]
+		frame = self.frame
+		while True:
+			op, arg = ops[pc]
+			pc += 1
+			if op == LOAD:
+				push(variables[arg] if arg in variables else self.doREF((REF, arg)))
+			elif op == LINE:
+				# the bytecode has no single place where a line ends, so each line is timed until the next line of the same call starts or the call returns
+				if profile:
+					if profiled != None:
+						self.profilestop("lines", profiled)
+					self.profilestart("lines", arg)
+					profiled = arg
+				self.executionline = arg
+			elif op == LOADF:
+				value = frame[arg[0]]
+				if value == None:
+					value = self.doREF((REF, arg[1]))
+				push(value)
+			elif op == BINC:
+				stack[-1] = totoken(arg[0](stack[-1].value, arg[1]))
+			elif op == FORITER:
+				v = next(stack[-1], DONE)
+				if v is DONE:
+					pop()
+					pc = arg[2]
+				else:
+					if arg[1] == None:
+						variables[arg[0]] = totoken(v)
+					else:
+						frame[arg[1]] = totoken(v)
+					pc = arg[3]
+			elif op == AUG:
+				value = pop()
+				current = variables[arg[1]] if arg[1] in variables else self.doREF((REF, arg[1]))
+				variables[arg[1]] = addto(current, value) if arg[0] == None else totoken(arg[0](current.value, value.value))
+			elif op == JUMPF:
+				if not pop():
+					pc = arg
+			elif op == PUSH:
+				push(arg)
+			elif op == CALL or op == CALLS:
+				if op == CALL:
+					name = arg[0]
+					args = self.popvalues(stack, arg[1])
+				else:
+					name = arg
+					args = pop()
+				if name not in entries and name in self.funcaliases:
+					name = self.funcaliases[name]
+				if name in builtins and name not in entries:
+					push(totoken(builtins[name](*[arg.value for arg in args])))
+				elif name in entries and name not in self.nativefuncs:
+					if tracecall:
+						self.trace("call", 1, f"{name}({', '.join(str(arg) for arg in args)})")
+					frames.append((pc, frame, self.slots, self.executionline, name, len(stack)))
+					# the calling line keeps running while the call does, like it does line by line, so its total includes the call
+					if profile:
+						self.profilestart("functions", name)
+						profiled = None
+					frame = self.frame = self.newframe(name, args)
+					self.slots = self.funcslots[name]
+					pc = entries[name]
+				else:
+					push(self.runfunc(name, *args))
+			elif op == POP:
+				pop()
+			elif op == JUMP:
+				pc = arg
+			elif op == BINL:
+				right = variables[arg[1]] if arg[1] in variables else self.doREF((REF, arg[1]))
+				stack[-1] = totoken(arg[0](stack[-1].value, right.value))
+			elif op == BINLF:
+				right = frame[arg[1]]
+				if right == None:
+					right = self.doREF((REF, arg[2]))
+				stack[-1] = totoken(arg[0](stack[-1].value, right.value))
+			elif op == STOREF:
+				frame[arg] = pop()
+			elif op == STORE:
+				variables[arg] = pop()
+			elif op == AUGF:
+				value = pop()
+				current = frame[arg[1]]
+				if current == None:
+					current = self.doREF((REF, arg[2]))
+				frame[arg[1]] = addto(current, value) if arg[0] == None else totoken(arg[0](current.value, value.value))
+			elif op == RET:
+				pc, callerframe, slots, self.executionline, name, height = frames.pop()
+				# the returning call's last line stops and the calling line, still running since the call, is timed again
+				if profile:
+					if profiled != None:
+						self.profilestop("lines", profiled)
+					if pc != None:
+						self.profilestop("functions", name)
+						profiled = self.executionline
+				self.freeframe(name, frame)
+				frame = self.frame = callerframe
+				self.slots = slots
+				# drops the iterators of loops that were returned from
+				value = pop()
+				del stack[height:]
+				if pc == None:
+					return value
+				push(value)
+			elif op == BIN:
+				right = pop().value
+				stack[-1] = totoken(arg(stack[-1].value, right))
+			elif op == TAILCALL:
+				name = arg[0]
+				args = self.popvalues(stack, arg[1])
+				if name in entries and name not in self.nativefuncs:
+					if tracecall:
+						self.trace("call", 1, f"{name}({', '.join(str(arg) for arg in args)})")
+					record = frames[-1]
+					# the call that is replaced stops at its last line, the calling line keeps running
+					if profile and profiled != None:
+						self.profilestop("lines", profiled)
+						profiled = None
+					if profile and record[0] != None:
+						self.profilestop("functions", record[4])
+						self.profilestart("functions", name)
+					# the time of a call from the line by line interpreter stays with the function it called, only the call is counted
+					elif profile:
+						self.profile["functions"].setdefault(name, [0, 0.0, 0.0])[0] += 1
+					self.freeframe(record[4], frame)
+					del stack[record[5]:]
+					frames[-1] = record[:4] + (name, record[5])
+					frame = self.frame = self.newframe(name, args)
+					self.slots = self.funcslots[name]
+					pc = entries[name]
+				else:
+					push(self.runfunc(name, *args))
+			elif op == DUP:
+				push(stack[-1])
+			elif op == INDEX:
+				ind = pop().value
+				if stack[-1].type not in SUBSCRIPT:
+					self.ERROR(11)
+				stack[-1] = totoken(stack[-1][ind])
+			elif op == JUMPFK:
+				if stack[-1]:
+					pop()
+				else:
+					pc = arg
+			elif op == JUMPTK:
+				if stack[-1]:
+					pc = arg
+				else:
+					pop()
+			elif op == NEG:
+				stack[-1] = totoken(-stack[-1].value)
+			elif op == NOT:
+				stack[-1] = totoken(not stack[-1].value)
+			elif op == MKLST:
+				push(Token(LST, [v.value for v in self.popvalues(stack, arg)]))
+			elif op == MKDCT:
+				values = self.popvalues(stack, arg*2)
+				final = {}
+				for i in range(0, len(values), 2):
+					final[values[i].value] = values[i+1].value
+				push(Token(DCT, final))
+			elif op == RANGE:
+				values = [v.value for v in self.popvalues(stack, 3)]
+				if traceloop:
+					self.trace("loop", 1, f"for {ops[pc][1][0]}")
+				push(iter(range(*values)))
+			elif op == ITER:
+				if traceloop:
+					self.trace("loop", 1, f"for {ops[pc][1][0]}")
+				stack[-1] = self.loopvalues(stack[-1].value)
+			elif op == NEWARGS:
+				push([])
+			elif op == APPEND:
+				v = pop()
+				stack[-1].append(v)
+			elif op == EXTEND:
+				v = pop()
+				stack[-1].extend(map(totoken, v.value))
+			elif op == ALIAS:
+				self.funcaliases[arg[1]] = arg[0]
+				self.funcnames.append(arg[1])
+			elif op == NEW:
+				push(self.doNEW((None,) + arg))
+			elif op == HALT:
+				if profile and profiled != None:
+					self.profilestop("lines", profiled)
+				return
+	# translates script functions into python functions, functions that can't be translated keep running line by line
+	def transpilefuncs (self):
+		module = ast.Module(body=[], type_ignores=[])
+		for name in self.funcs:
+			try:
+				module.body.append(self.transpilefunc(name))
+			except (NotImplementedError, SyntaxError):
+				continue
+		namespace = {"_get" : self.nativeget, "_call" : self.nativeslow}
+		for name in self.builtins:
+			namespace["f_"+name] = self.nativebuiltin(name)
+		for name in self.funcs:
+			namespace["f_"+name] = (lambda name: lambda *args: self.nativeslow(name, *args))(name)
+		ast.fix_missing_locations(module)
+		exec(compile(module, "<slow++>", "exec"), namespace)
+		for func in module.body:
+			self.nativefuncs[func.name[2:]] = namespace[func.name]
+	# translates a single function into a python function definition
+	def transpilefunc (self, name):
+		start, end = self.funcs[name]
+		params = self.funcargs[name]
+		# the locals that are certainly assigned, a local that is read before it is assigned reads the global with the same name, which python functions can't do, so those functions aren't translated
+		assigned = set(params)
+		body = []
+		pos = self.transpileblock(start, end, body, assigned)
+		if pos != end:
+			raise NotImplementedError()
+		if len(body) == 0:
+			body.append(ast.Pass())
+		# extra arguments are ignored the same as they are by runfunc, calls with missing arguments are run line by line
+		func = ast.parse("def f (*_rest): pass").body[0]
+		func.name = "f_"+name
+		func.args.args = [ast.arg(arg="v_"+p) for p in params]
+		func.body = body
+		return func
+	# translates lines until the line that closes the current block, returns the position of that line
+	def transpileblock (self, pos, end, body, assigned):
+		while pos < end:
+			text = self.code[pos].lstrip("\t")
+			if len(text) > 0 and text[0] == "}":
+				return pos
+			if text[:5] == "func ":
+				raise NotImplementedError()
+			self.executionline = pos
+			stmt = self.linenode(pos)
+			kind = stmt[0]
+			if kind == "EXP":
+				node = stmt[1]
+				if node[0] == ASS:
+					body.append(self.transpileassign(node, assigned))
+				else:
+					body.append(ast.Expr(self.transpilenode(node, assigned)))
+			elif kind == "return":
+				value = None
+				if stmt[1] != None:
+					value = self.transpilenode(stmt[1], assigned)
+				body.append(ast.Return(value))
+			elif kind == "break":
+				body.append(ast.Break())
+			elif kind == "continue":
+				body.append(ast.Continue())
+			elif kind == "if":
+				pos, node = self.transpileif(pos, end, stmt, assigned)
+				body.append(node)
+			elif kind == "while":
+				inner = []
+				# assignments in a block only count inside it, the block might not run
+				pos = self.transpileblock(pos+1, end, inner, set(assigned))
+				body.append(ast.While(self.transpilenode(stmt[1], assigned), inner or [ast.Pass()], []))
+			elif kind == "for":
+				inner = []
+				pos = self.transpileblock(pos+1, end, inner, assigned | {stmt[1]})
+				if stmt[3] == None:
+					loop = self.transpilenode(stmt[2], assigned)
+				else:
+					loop = ast.Call(ast.Name("range", ast.Load()), [self.transpilenode(node, assigned) for node in stmt[2:5]], [])
+				body.append(ast.For(ast.Name("v_"+stmt[1], ast.Store()), loop, inner or [ast.Pass()], []))
+			elif kind != "NOP":
+				raise NotImplementedError()
+			pos += 1
+		return pos
+	# translates an if statement along with its elif and else branches, returns the position of the last closing bracket and the node
+	def transpileif (self, pos, end, stmt, assigned):
+		inner = []
+		close = self.transpileblock(pos+1, end, inner, set(assigned))
+		node = ast.If(self.transpilenode(stmt[1], assigned), inner or [ast.Pass()], [])
+		if pos not in self.branches:
+			return close, node
+		pos = self.branches[pos]
+		self.executionline = pos
+		stmt = self.linenode(pos)
+		if stmt[0] == "elif":
+			pos, branch = self.transpileif(pos, end, stmt, assigned)
+			node.orelse = [branch]
+		else:
+			pos = self.transpileblock(pos+1, end, node.orelse, set(assigned))
+		return pos, node
+	# translates an assignment used as a statement
+	def transpileassign (self, node, assigned):
+		target = ast.Name("v_"+node[2], ast.Store())
+		value = self.transpilenode(node[3], assigned)
+		if node[1] == "=":
+			assigned.add(node[2])
+			return ast.Assign([target], value)
+		self.transpilelocal(node[2], assigned)
+		return ast.AugAssign(target, PYOPS[node[1][0]](), value)
+	# reads a local variable, raises NotImplementedError if it might not be assigned yet
+	def transpilelocal (self, name, assigned):
+		if name not in assigned:
+			raise NotImplementedError()
+		return ast.Name("v_"+name, ast.Load())
+	# translates an expression
+	def transpilenode (self, node, assigned):
+		kind = node[0]
+		if kind == "CON":
+			if node[1].type not in (INT, STR, LIT):
+				raise NotImplementedError()
+			return ast.Constant(node[1].detokenize())
+		elif kind == "NEW":
+			return self.pyliteral(node[1].value)
+		elif kind == "LOC":
+			return self.transpilelocal(node[2], assigned)
+		elif kind == REF:
+			return ast.Call(ast.Name("_get", ast.Load()), [ast.Constant(node[1])], [])
+		elif kind == MAT or (kind == LOG and node[1] in "^%"):
+			right = self.transpilenode(node[3], assigned)
+			if node[2] == None:
+				return ast.UnaryOp(ast.USub(), right)
+			return ast.BinOp(self.transpilenode(node[2], assigned), PYOPS[node[1]](), right)
+		elif kind == EQU:
+			return ast.Compare(self.transpilenode(node[2], assigned), [PYOPS[node[1]]()], [self.transpilenode(node[3], assigned)])
+		elif kind == LOG:
+			right = self.transpilenode(node[3], assigned)
+			if node[1] == "!":
+				return ast.UnaryOp(ast.Not(), right)
+			return ast.BoolOp(PYOPS[node[1]](), [self.transpilenode(node[2], assigned), right])
+		elif kind == ASS:
+			value = self.transpilenode(node[3], assigned)
+			# an assignment within an expression might not run, so it doesn't make the name assigned
+			if node[1] != "=":
+				value = ast.BinOp(self.transpilelocal(node[2], assigned), PYOPS[node[1][0]](), value)
+			return ast.NamedExpr(ast.Name("v_"+node[2], ast.Store()), value)
+		elif kind == FUN:
+			args = []
+			for arg in node[2]:
+				if arg[0] == "STA":
+					args.append(ast.Starred(self.transpilenode(arg[1], assigned), ast.Load()))
+				else:
+					args.append(self.transpilenode(arg, assigned))
+			name = node[1]
+			# calls to script functions with missing arguments go through runfunc, which runs them line by line
+			if name in self.funcs and (node[3] or len(args) < len(self.funcargs[name])):
+				return ast.Call(ast.Name("_call", ast.Load()), [ast.Constant(name)] + args, [])
+			if name in self.funcs or name in self.builtins:
+				return ast.Call(ast.Name("f_"+name, ast.Load()), args, [])
+			return ast.Call(ast.Name("_call", ast.Load()), [ast.Constant(name)] + args, [])
+		elif kind == LST:
+			return ast.List([self.transpilenode(item, assigned) for item in node[1]], ast.Load())
+		elif kind == DCT:
+			return ast.Dict([self.transpilenode(k, assigned) for k, v in node[1]], [self.transpilenode(v, assigned) for k, v in node[1]])
+		elif kind == SQU:
+			return ast.Subscript(self.transpilenode(node[1], assigned), self.transpilenode(node[2], assigned), ast.Load())
+		raise NotImplementedError()
+	# builds the python expression for a constant list or dict
+	def pyliteral (self, value):
+		if type(value) == list:
+			return ast.List([self.pyliteral(item) for item in value], ast.Load())
+		if type(value) == dict:
+			return ast.Dict([self.pyliteral(key) for key in value], [self.pyliteral(value[key]) for key in value])
+		return ast.Constant(value)
+	# wraps a builtin for translated functions, its result is converted the same way runfunc converts it, so dict keys become lists
+	def nativebuiltin (self, name):
+		func = self.builtins[name]
+		if name in self.tokenbuiltins:
+			return lambda *args: totoken(func(*[totoken(arg) for arg in args])).value
+		return lambda *args: totoken(func(*args)).value
+	# reads a global variable from a translated function
+	def nativeget (self, name):
+		if name not in self.vars:
+			self.ERROR(6)
+		return self.vars[name].detokenize()
+	# calls a function that wasn't translated from a translated function
+	def nativeslow (self, name, *args):
+		return self.runfunc(name, *[totoken(arg) for arg in args]).detokenize()
+	# the file a program's compiled form is cached in
+	def cachepath (self):
+		return self.path + "c"
+	# saves everything the loader and compiler worked out about the program
+	def savecache (self, key):
+		cache = {
+			"key" : key,
+			"lines" : self.code,
+			"flags" : self.flags,
+			"sfconfig" : self.sfconfig,
+			"funcs" : self.funcs,
+			"funcargs" : self.funcargs,
+			"funcslots" : self.funcslots,
+			"funcnames" : self.funcnames,
+			"funclines" : self.funclines,
+			"linefuncs" : self.linefuncs,
+			"skiplines" : self.skiplines,
+			"constnames" : self.constnames,
+			"blockends" : self.blockends,
+			"branches" : self.branches,
+			"nodes" : {index : self.encodenode(self.nodecache[index]) for index in self.nodecache},
+		}
+		# a cache that can't be written, or flags that can't be stored, only mean the program is compiled again next time
+		try:
+			data = marshal.dumps(cache)
+		except ValueError:
+			return
+		# each run writes its own temporary file, so runs of the same script at the same time never mix their caches, and the finished file replaces the cache in one step
+		path = self.cachepath()
+		try:
+			handle, temp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=os.path.basename(path) + ".")
+		except OSError:
+			return
+		try:
+			with os.fdopen(handle, "wb") as f:
+				f.write(data)
+			os.replace(temp, path)
+		except OSError:
+			try:
+				os.remove(temp)
+			except OSError:
+				pass
+	# loads the cached form of the program if it is for the same source, returns if it was loaded
+	def loadcache (self, key):
+		try:
+			with open(self.cachepath(), "rb") as f:
+				cache = marshal.loads(f.read())
+		except (OSError, EOFError, ValueError, TypeError):
+			return False
+		if type(cache) != dict or cache.get("key") != key:
+			return False
+		self.code = cache["lines"]
+		self.flags.update(cache["flags"])
+		self.sfconfig = cache["sfconfig"]
+		self._process_tmp_flags()
+		self._setupasync()
+		for name in ("funcs", "funcargs", "funcslots", "funcnames", "funclines", "linefuncs", "skiplines", "constnames", "blockends", "branches"):
+			setattr(self, name, cache[name])
+		self.framepool = {name : [] for name in self.funcs}
+		self.tokencache = {}
+		self.nodecache = {index : self.decodenode(node) for index, node in cache["nodes"].items()}
+		return True
+	# converts the tokens in a compiled node into (None, type, value) tuples so that it can be marshalled
+	def encodenode (self, node):
+		if type(node) == Token:
+			return (None, node.type, node.value)
+		if type(node) == tuple:
+			return tuple(self.encodenode(item) for item in node)
+		return node
+	# converts an encoded node back, constants become the shared tokens again where there are any
+	def decodenode (self, node):
+		if type(node) != tuple:
+			return node
+		if len(node) == 3 and node[0] == None:
+			token = totoken(node[2])
+			if token.type != node[1]:
+				token = Token(node[1], node[2])
+			return token
+		return tuple(self.decodenode(item) for item in node)
+	def exit (self):
+		if self.flags["showfams"]:
+			self._displayfams()
+		if self.flags["showflags"]:
+			self._displayflags()
+		if self.flags["showvars"]:
+			print(self.vars)
+		if self.flags["showlocals"]:
+			print({name : self.frame[self.slots[name]] for name in self.slots})
+		if self.flags["pel"]:
+			print(self.executionline)
+		if self.flags["funcnames"]:
+			print(self.funcnames)
+		if self.flags["funclines"]:
+			print(sorted(self.funclines))
+		if self.flags["funcargs"]:
+			print(self.funcargs)
+		if self.flags["profile"]:
+			self._displayprofile()
+		for entry in self.tracelog:
+			print(entry)
+		if self.tracestream != None:
+			self.tracestream.close()
+	def run (self):
+		# only a program read from a file has a cache
+		key = None if self.path == None else cachekey(self.source, self.builtins)
+		cached = key != None and self.loadcache(key)
+		if not cached:
+			self.code = self.load(self.source)
+		self._setuptrace()
+		self._setupprofile()
+		if not cached:
+			if self.flags["fold"] or self.flags["cache"]:
+				self.optimize()
+			if self.flags["cache"] and self.path != None:
+				self.savecache(key)
+		if self.flags["native"]:
+			self.transpilefuncs()
+		main = self.runvm if self.flags["vm"] else self.runlines
+		try:
+			# the top level of the program is the first task when the program runs as tasks
+			if self.scheduler != None:
+				self.scheduler.run(main)
+			else:
+				main()
+		except:
+			self.exit()
+			raise
+		self.exit()
+	# runs the top level of the program line by line
+	def runlines (self):
+		self.executionline = -1
+		while self.executionline < len(self.code):
+			self.executionline += 1
+			if self.executionline in self.funclines or self.executionline in self.skiplines:
+				continue
+			if self.executionline >= len(self.code):
+				break
+			self.runline(self.executionline)
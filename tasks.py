@@ -0,0 +1,94 @@
+"""
+runs slow++ functions as concurrent tasks on an asyncio event loop, used by Runners with the async flag
+
+the interpreter runs a program by recursing through python calls, so a slow++ function can't be suspended like a coroutine, instead each task runs on its own thread and a lock lets only one task run slow++ code at a time
+a task only gives the lock up inside the builtins that wait, so tasks switch at the same points that coroutines would switch at an await
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+class Scheduler ():
+	def __init__ (self, runner):
+		self.runner = runner
+		# held by the task that is running slow++ code
+		self.lock = threading.Lock()
+		# the event loop that sleeps and subprocesses are waited on in
+		self.loop = None
+		# tasks that were started but haven't been waited on, each task is a future of what its function returned
+		self.tasks = []
+		# the builtins added to the runner, input replaces the one that blocks every task
+		self.builtins = {
+			"spawn" : self.spawn,
+			"wait" : self.wait,
+			"sleep" : self.sleep,
+			"input" : self.input,
+			"readfile" : self.readfile,
+			"shell" : self.shell,
+		}
+	# runs main, the top level of the program, as the first task then waits for the tasks that were started and never waited on
+	def run (self, main):
+		asyncio.run(self._run(main))
+	async def _run (self, main):
+		self.loop = asyncio.get_running_loop()
+		await asyncio.wrap_future(self._start(main))
+		# tasks can start more tasks while they are waited on
+		while len(self.tasks) > 0:
+			await asyncio.wrap_future(self.tasks.pop(0))
+	# starts func on its own thread, it runs once the task holding the lock waits
+	def _start (self, func, *args):
+		task = concurrent.futures.Future()
+		def body ():
+			with self.lock:
+				# a task starts at the top level of the program, like the program itself, with nothing being profiled
+				self.runner.frame, self.runner.slots, self.runner.depth = [], {}, 0
+				self.runner.profilestack = {"lines" : [], "functions" : []}
+				self.runner.profileactive = {"lines" : {}, "functions" : {}}
+				try:
+					task.set_result(func(*args))
+				except BaseException as e:
+					task.set_exception(e)
+		threading.Thread(target=body, daemon=True).start()
+		return task
+	# calls wait without the lock so that other tasks run, the runner is put back the way this task left it before it carries on
+	def _blocking (self, wait, *args):
+		runner = self.runner
+		# each task profiles its own lines and calls, the time it spends waiting counts towards them like any other time
+		state = runner.frame, runner.slots, runner.executionline, runner.depth, runner.profilestack, runner.profileactive
+		self.lock.release()
+		try:
+			return wait(*args)
+		finally:
+			self.lock.acquire()
+			runner.frame, runner.slots, runner.executionline, runner.depth, runner.profilestack, runner.profileactive = state
+	# waits for a coroutine on the event loop
+	def _await (self, coroutine):
+		return self._blocking(lambda: asyncio.run_coroutine_threadsafe(coroutine, self.loop).result())
+	# starts a task that calls a slow++ function
+	def spawn (self, fname, *args):
+		task = self._start(self.runner.nativeslow, fname, *args)
+		self.tasks.append(task)
+		return task
+	# waits for a task to finish and returns what its function returned, an error in the task is raised here
+	def wait (self, task):
+		if task in self.tasks:
+			self.tasks.remove(task)
+		return self._blocking(task.result)
+	def sleep (self, seconds):
+		self._await(asyncio.sleep(seconds))
+	# the task is already a thread of its own, so reading only has to give up the lock
+	def input (self, prompt=""):
+		return self._blocking(input, prompt)
+	def readfile (self, path):
+		def read ():
+			with open(path) as f:
+				return f.read()
+		return self._blocking(read)
+	# runs a shell command and returns its exit code and everything it printed
+	def shell (self, command):
+		async def run ():
+			process = await asyncio.create_subprocess_shell(command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+			output, _ = await process.communicate()
+			return {"code" : process.returncode, "output" : output.decode()}
+		return self._await(run())
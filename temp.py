@@ -45,4 +45,4 @@ def tmpdictitems (d):
 	return d.items()
 
 def tmpdictvalues (d):
-	return d.values()
\ No newline at end of file
+	return d.values()